@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Authentication Tests
+Runs token verification and the auth dependencies without an API server
+"""
+
+import os
+import sys
+import time
+from datetime import timedelta
+from typing import Annotated
+from unittest import mock
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from auth.dependencies import require_user
+from services import auth_service, user_service
+from services.auth_service import AuthService
+
+# Users by bearer token for the require_user tests
+USERS = {
+    "host": {"id": 1, "is_active": True, "is_host": True, "is_verified": True},
+    "unverified-host": {"id": 2, "is_active": True, "is_host": True, "is_verified": False},
+    "guest": {"id": 3, "is_active": True, "is_host": False, "is_verified": True},
+    "inactive": {"id": 4, "is_active": False, "is_host": True, "is_verified": True},
+}
+
+# Route -> require_user flags
+FLAG_ROUTES = {
+    "/active": {},
+    "/any": {"active": False},
+    "/host": {"host": True},
+    "/verified": {"verified": True},
+    "/verified-host": {"host": True, "verified": True},
+}
+
+
+def _raises_401(call):
+    """True if call raises the 401 that verify_token uses for bad tokens"""
+    try:
+        call()
+    except HTTPException as e:
+        return e.status_code == 401
+    return False
+
+
+def test_verified_tokens_are_cached():
+    """Repeat verifications of a valid token reuse the decoded payload"""
+    auth = AuthService(user_service)
+    token = auth.create_access_token({"sub": "john.doe@example.com"})
+
+    payload = auth.verify_token(token)
+    assert payload["sub"] == "john.doe@example.com"
+    assert auth.verify_token(token) is payload
+    assert auth._decode_token_cached.cache_info().hits == 1
+
+
+def test_invalid_tokens_are_not_cached():
+    """Rejected tokens raise every time and never enter the cache"""
+    auth = AuthService(user_service)
+
+    for _ in range(2):
+        assert _raises_401(lambda: auth.verify_token("not-a-token"))
+    assert auth._decode_token_cached.cache_info().currsize == 0
+
+
+def test_cached_token_expiry_is_rechecked():
+    """A token cached while valid is rejected once it expires"""
+    auth = AuthService(user_service)
+    token = auth.create_access_token(
+        {"sub": "john.doe@example.com"}, expires_delta=timedelta(milliseconds=300)
+    )
+
+    assert auth.verify_token(token)["sub"] == "john.doe@example.com"
+    assert auth._decode_token_cached.cache_info().currsize == 1
+
+    time.sleep(0.4)
+    assert _raises_401(lambda: auth.verify_token(token))
+
+
+def _flags_client():
+    """Test client with one route per FLAG_ROUTES entry, returning the user's id"""
+    app = FastAPI()
+    for path, flags in FLAG_ROUTES.items():
+        def endpoint(user: Annotated[dict, Depends(require_user(**flags))]):
+            return user["id"]
+        app.get(path)(endpoint)
+    return TestClient(app)
+
+
+def _lookup_user(token):
+    if token not in USERS:
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
+    return USERS[token]
+
+
+def test_require_user_flag_combinations():
+    """Each flag combination admits exactly the users that satisfy it"""
+    expected = {
+        # route: {token: status}
+        "/active": {"host": 200, "unverified-host": 200, "guest": 200, "inactive": 400},
+        "/any": {"host": 200, "unverified-host": 200, "guest": 200, "inactive": 200},
+        "/host": {"host": 200, "unverified-host": 200, "guest": 403, "inactive": 400},
+        "/verified": {"host": 200, "unverified-host": 403, "guest": 200, "inactive": 400},
+        "/verified-host": {"host": 200, "unverified-host": 403, "guest": 403, "inactive": 400},
+    }
+    client = _flags_client()
+    with mock.patch.object(auth_service, "get_current_user_from_token", side_effect=_lookup_user):
+        for path, statuses in expected.items():
+            for token, status_code in statuses.items():
+                response = client.get(path, headers={"Authorization": f"Bearer {token}"})
+                assert response.status_code == status_code, (path, token, response.text)
+                if status_code == 200:
+                    assert response.json() == USERS[token]["id"]
+
+            assert client.get(path, headers={"Authorization": "Bearer nobody"}).status_code == 401
+            assert client.get(path).status_code == 403
+            assert client.get(path, headers={"Authorization": "Basic host"}).status_code == 403
+
+
+def test_require_user_is_memoized_and_resolved_once():
+    """Equal flags give the same dependency, which runs once per request"""
+    assert require_user(host=True) is require_user(host=True)
+    assert require_user() is not require_user(host=True)
+
+    router = APIRouter(dependencies=[Depends(require_user(host=True))])
+
+    @router.get("/mine")
+    def mine(user: Annotated[dict, Depends(require_user(host=True))]):
+        return user["id"]
+
+    app = FastAPI()
+    app.include_router(router)
+    with mock.patch.object(
+        auth_service, "get_current_user_from_token", side_effect=_lookup_user
+    ) as lookup:
+        response = TestClient(app).get("/mine", headers={"Authorization": "Bearer host"})
+
+    assert response.status_code == 200
+    assert lookup.call_count == 1
+
+
+def main():
+    """Run all authentication tests"""
+    print("🧪 STARTING AUTHENTICATION TESTS")
+    print("="*50)
+
+    test_functions = [
+        test_verified_tokens_are_cached,
+        test_invalid_tokens_are_not_cached,
+        test_cached_token_expiry_is_rechecked,
+        test_require_user_flag_combinations,
+        test_require_user_is_memoized_and_resolved_once,
+    ]
+
+    failed = 0
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test_func.__name__}: {e!r}")
+
+    print("="*50)
+    print(f"Passed: {len(test_functions) - failed}/{len(test_functions)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Booking Route and Service Tests
+Runs the booking handlers directly, without an API server
+"""
+
+import os
+import sys
+from unittest import mock
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import bookings as bookings_routes
+from auth.dependencies import get_current_active_user
+from services import booking_service, user_service
+
+
+def _client_for(user_id):
+    """Test client for the bookings router, signed in as the given user from users.json"""
+    app = FastAPI()
+    app.include_router(bookings_routes.router)
+    user = user_service.get_by_id(user_id)
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    return TestClient(app)
+
+
+def _invalidated_patterns(call, existing, updated):
+    """Run a booking write with the service stubbed; return the invalidated patterns"""
+    with mock.patch.object(booking_service, "get_by_id", return_value=existing), \
+            mock.patch.object(booking_service, "update", return_value=updated), \
+            mock.patch.object(bookings_routes, "invalidate_cache") as invalidate:
+        assert call() == updated
+    return sorted(c.args[0] for c in invalidate.call_args_list)
+
+
+def test_update_invalidates_old_and_new_property():
+    """Moving a booking clears availability for both properties"""
+    existing = {"id": 1, "property_id": 5, "status": "pending"}
+    updated = {"id": 1, "property_id": 7, "status": "pending"}
+    patterns = _invalidated_patterns(
+        lambda: bookings_routes.update_booking(1, {"property_id": 7}), existing, updated
+    )
+    assert patterns == ["avail:5:*", "avail:7:*"]
+
+
+def test_update_invalidates_property_once():
+    """Changing dates on the same property clears its availability once"""
+    existing = {"id": 1, "property_id": 5, "check_in_date": "2025-01-01"}
+    updated = {"id": 1, "property_id": 5, "check_in_date": "2025-02-01"}
+    patterns = _invalidated_patterns(
+        lambda: bookings_routes.update_booking(1, {"check_in_date": "2025-02-01"}),
+        existing, updated
+    )
+    assert patterns == ["avail:5:*"]
+
+
+def test_confirm_and_cancel_invalidate_availability():
+    """Status changes clear availability for the booking's property"""
+    pending = {"id": 2, "room_id": 9, "status": "pending"}
+    confirmed = {**pending, "status": "confirmed"}
+    cancelled = {**pending, "status": "cancelled"}
+
+    assert _invalidated_patterns(
+        lambda: bookings_routes.confirm_booking(2), pending, confirmed
+    ) == ["avail:9:*"]
+    assert _invalidated_patterns(
+        lambda: bookings_routes.cancel_booking(2), confirmed, cancelled
+    ) == ["avail:9:*"]
+
+
+def test_host_lists_their_property_bookings():
+    """The host in rooms.json gets the property's bookings, under property_id or room_id"""
+    response = _client_for(1).get("/bookings/property/2")
+    assert response.status_code == 200, response.text
+    bookings = response.json()
+    assert bookings and all(str(b["room_id"]) == "2" for b in bookings)
+    assert response.headers["X-Total-Count"] == str(len(bookings))
+
+
+def test_other_hosts_get_not_found():
+    """Another host, or a guest, can't list a property's bookings"""
+    for user_id in (2, 3):
+        response = _client_for(user_id).get("/bookings/property/2")
+        assert response.status_code == 404, (user_id, response.text)
+
+    # Host 2 owns property 5, which has no bookings yet
+    response = _client_for(2).get("/bookings/property/5")
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+
+def test_after_id_pages_through_unordered_bookings():
+    """Cursor pages follow booking IDs even when the file isn't in ID order"""
+    stored = [
+        {"id": bid, "room_id": 2, "guest_id": 3, "status": "confirmed"}
+        for bid in (7, 2, 9, 4, 12)
+    ]
+    with mock.patch.object(booking_service.data_manager, "load", return_value=stored):
+        pages = []
+        after_id = 0
+        for _ in range(len(stored) + 1):  # bounded, in case the cursor stops advancing
+            page, total = booking_service.get_property_bookings(
+                2, None, limit=2, after_id=after_id
+            )
+            if not page:
+                break
+            pages.append([b["id"] for b in page])
+            after_id = page[-1]["id"]
+
+    assert total == 5
+    assert pages == [[2, 4], [7, 9], [12]]
+
+
+def main():
+    """Run all booking tests"""
+    print("🧪 STARTING BOOKING TESTS")
+    print("="*50)
+
+    test_functions = [
+        test_update_invalidates_old_and_new_property,
+        test_update_invalidates_property_once,
+        test_confirm_and_cancel_invalidate_availability,
+        test_host_lists_their_property_bookings,
+        test_other_hosts_get_not_found,
+        test_after_id_pages_through_unordered_bookings,
+    ]
+
+    failed = 0
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test_func.__name__}: {e!r}")
+
+    print("="*50)
+    print(f"Passed: {len(test_functions) - failed}/{len(test_functions)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
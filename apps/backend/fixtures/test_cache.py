@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Cache Module Tests
+Exercises utils.cache against an in-memory stand-in for the Redis client
+"""
+
+import asyncio
+import os
+import sys
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from redis.exceptions import RedisError
+
+from utils import cache as cache_module
+
+
+class FakeAsyncRedis:
+    """The handful of redis.asyncio commands utils.cache uses, kept in a dict"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = str(value).encode()
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value if isinstance(value, bytes) else value.encode()
+
+    async def exists(self, key):
+        return int(key in self.store)
+
+    async def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+
+class BrokenRedis:
+    """Sync client whose every command fails like a dropped connection"""
+
+    def get(self, key):
+        raise RedisError("connection lost")
+
+    def setex(self, key, ttl, value):
+        raise RedisError("connection lost")
+
+
+class _NoInflight(dict):
+    """_inflight that never coalesces, so each caller acts like its own worker"""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+@contextmanager
+def fake_redis(separate_workers=False):
+    """Point utils.cache at a FakeAsyncRedis for the duration of the block"""
+    client = FakeAsyncRedis()
+    patches = [
+        mock.patch.object(cache_module, "REDIS_AVAILABLE", True),
+        mock.patch.object(cache_module, "async_redis_client", client),
+    ]
+    if separate_workers:
+        patches.append(mock.patch.object(cache_module, "_inflight", _NoInflight()))
+    for patch in patches:
+        patch.start()
+    try:
+        yield client
+    finally:
+        for patch in reversed(patches):
+            patch.stop()
+
+
+def test_single_flight_fast_winner_releases_waiters():
+    """A waiter stops polling once a fast (uncached) winner drops its lock"""
+    calls = []
+
+    @cache_module.cache(ttl=60, key="sf:fast:{item_id}", min_execution_time=1.0)
+    async def fast_lookup(item_id: int):
+        calls.append(item_id)
+        await asyncio.sleep(0.001)
+        return {"item_id": item_id}
+
+    async def run():
+        return await asyncio.gather(fast_lookup(item_id=1), fast_lookup(item_id=1))
+
+    with fake_redis(separate_workers=True) as client:
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+    assert results == [{"item_id": 1}, {"item_id": 1}]
+    # Too fast to cache, so the waiter computes for itself once the lock is gone
+    assert len(calls) == 2
+    assert "lock:cache:sf:fast:1" not in client.store
+    assert elapsed < cache_module.SINGLE_FLIGHT_WAIT / 2, f"waiter blocked for {elapsed:.2f}s"
+
+
+def test_single_flight_failing_winner_releases_waiters():
+    """A winner that raises doesn't leave the other worker waiting out the timeout"""
+    calls = []
+
+    @cache_module.cache(ttl=60, key="sf:error:{item_id}")
+    async def failing_lookup(item_id: int):
+        calls.append(item_id)
+        await asyncio.sleep(0.001)
+        if len(calls) == 1:
+            raise LookupError("not found")
+        return {"item_id": item_id}
+
+    async def run():
+        return await asyncio.gather(
+            failing_lookup(item_id=2), failing_lookup(item_id=2), return_exceptions=True
+        )
+
+    with fake_redis(separate_workers=True):
+        start = time.perf_counter()
+        first, second = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+    assert isinstance(first, LookupError)
+    assert second == {"item_id": 2}
+    assert elapsed < cache_module.SINGLE_FLIGHT_WAIT / 2, f"waiter blocked for {elapsed:.2f}s"
+
+
+def test_empty_result_is_a_cache_hit():
+    """A cached empty list is served from the cache, not recomputed"""
+    calls = []
+
+    @cache_module.cache(ttl=60, key="empty:{item_id}", min_execution_time=0)
+    async def empty_lookup(item_id: int):
+        calls.append(item_id)
+        return []
+
+    async def run():
+        return [await empty_lookup(item_id=3), await empty_lookup(item_id=3)]
+
+    with fake_redis():
+        assert asyncio.run(run()) == [[], []]
+
+    assert len(calls) == 1
+
+
+def test_bytes_helpers_treat_redis_errors_as_misses():
+    """The sync bytes helpers degrade on RedisError like the async ones"""
+    with mock.patch.object(cache_module, "REDIS_AVAILABLE", True), \
+            mock.patch.object(cache_module, "redis_client", BrokenRedis()):
+        assert cache_module.get_cached_bytes("houses:list:x") is None
+        cache_module.set_cached_bytes("houses:list:x", b"[]")
+
+
+def main():
+    """Run all cache tests"""
+    print("🧪 STARTING CACHE TESTS")
+    print("="*50)
+
+    test_functions = [
+        test_single_flight_fast_winner_releases_waiters,
+        test_single_flight_failing_winner_releases_waiters,
+        test_empty_result_is_a_cache_hit,
+        test_bytes_helpers_treat_redis_errors_as_misses,
+    ]
+
+    failed = 0
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test_func.__name__}: {e!r}")
+
+    print("="*50)
+    print(f"Passed: {len(test_functions) - failed}/{len(test_functions)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
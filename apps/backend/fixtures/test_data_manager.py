@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+DataManager Tests
+Checks that memoized indexes follow writes, using a temporary data directory
+"""
+
+import os
+import sys
+import tempfile
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_manager import DataManager
+
+
+def test_same_size_rewrite_changes_version():
+    """A save that keeps the file's mtime and size still invalidates memos"""
+    with tempfile.TemporaryDirectory() as base_path:
+        manager = DataManager(base_path=base_path)
+        other_manager = DataManager(base_path=base_path)
+
+        manager.save("bookings.json", [{"id": 1, "status": "aaaa"}])
+        file_path = os.path.join(base_path, "bookings.json")
+        file_stat = os.stat(file_path)
+        version = manager.version("bookings.json")
+        assert manager.get_index("bookings.json")["1"]["status"] == "aaaa"
+        assert other_manager.get_index("bookings.json")["1"]["status"] == "aaaa"
+
+        # Same size, and the mtime put back as if both writes fell in one tick
+        manager.save("bookings.json", [{"id": 1, "status": "bbbb"}])
+        os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        assert manager.stat_version("bookings.json") == version[:2]
+
+        assert manager.version("bookings.json") != version
+        assert other_manager.version("bookings.json") == manager.version("bookings.json")
+        assert manager.get_index("bookings.json")["1"]["status"] == "bbbb"
+        assert other_manager.get_index("bookings.json")["1"]["status"] == "bbbb"
+
+
+def main():
+    """Run all DataManager tests"""
+    print("🧪 STARTING DATA MANAGER TESTS")
+    print("="*50)
+
+    test_functions = [
+        test_same_size_rewrite_changes_version,
+    ]
+
+    failed = 0
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test_func.__name__}: {e!r}")
+
+    print("="*50)
+    print(f"Passed: {len(test_functions) - failed}/{len(test_functions)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Notification Service Tests
+Runs UserService's notification methods against a temporary copy of notifications.json
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services.user_service import UserService
+from utils.data_manager import DataManager
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'users')
+
+
+@contextmanager
+def notification_service():
+    """A fresh UserService reading and writing a scratch copy of the users data"""
+    with tempfile.TemporaryDirectory() as base_path:
+        shutil.copy(os.path.join(DATA_DIR, "notifications.json"), base_path)
+        service = UserService()
+        service.data_manager = DataManager(base_path=base_path)
+        yield service
+
+
+def _recounted(service, user_id):
+    """Unread count straight from the file, bypassing the service's memos"""
+    return sum(
+        1 for n in service.data_manager.load("notifications.json")
+        if n.get("user_id") == user_id and not n.get("is_read")
+    )
+
+
+def test_mark_read_keeps_unread_count_consistent():
+    """The memoized count and views match the file after each mark-read"""
+    with notification_service() as service:
+        unread, total = service.get_user_notifications(3, is_read=False)
+        assert total == service.get_unread_count(3) == _recounted(service, 3) > 1
+
+        updated = service.mark_notification_read(3, unread[0]["id"])
+        assert updated["is_read"] is True
+        assert service.get_unread_count(3) == _recounted(service, 3) == total - 1
+        assert service.get_user_notifications(3, is_read=False)[1] == total - 1
+
+        # Already read, another user's, or missing: nothing changes
+        assert service.mark_notification_read(3, unread[0]["id"])["is_read"] is True
+        assert service.mark_notification_read(1, unread[1]["id"]) is None
+        assert service.mark_notification_read(3, 10 ** 6) is None
+        assert service.get_unread_count(3) == _recounted(service, 3) == total - 1
+
+        assert service.mark_all_notifications_read(3) == total - 1
+        assert service.get_unread_count(3) == _recounted(service, 3) == 0
+        assert service.get_user_notifications(3, is_read=False) == ([], 0)
+
+        # Other users are untouched
+        assert service.get_unread_count(1) == _recounted(service, 1) == 2
+
+
+def test_unread_count_follows_writes_from_elsewhere():
+    """A write through another DataManager is picked up on the next count"""
+    with notification_service() as service:
+        before = service.get_unread_count(1)
+
+        other_manager = DataManager(base_path=str(service.data_manager.base_path))
+        notifications = other_manager.load("notifications.json")
+        for notification in notifications:
+            if notification["user_id"] == 1:
+                notification["is_read"] = True
+        other_manager.save("notifications.json", notifications)
+
+        assert before == 2
+        assert service.get_unread_count(1) == 0
+        assert service.get_user_notifications(1, is_read=False) == ([], 0)
+
+
+def main():
+    """Run all notification tests"""
+    print("🧪 STARTING NOTIFICATION TESTS")
+    print("="*50)
+
+    test_functions = [
+        test_mark_read_keeps_unread_count_consistent,
+        test_unread_count_follows_writes_from_elsewhere,
+    ]
+
+    failed = 0
+    for test_func in test_functions:
+        try:
+            test_func()
+            print(f"✅ {test_func.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test_func.__name__}: {e!r}")
+
+    print("="*50)
+    print(f"Passed: {len(test_functions) - failed}/{len(test_functions)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -68,13 +68,14 @@ def test_property_service():
         print(f"✅ Get all properties: {len(properties)} properties found")
 
         # Test search properties
-        search_results = property_service.search_properties(
+        search_results, total = property_service.search_properties(
             city="Los Angeles",
             min_price=100,
             max_price=500,
             limit=3
         )
-        print(f"✅ Search properties: {len(search_results)} results for LA, $100-500")
+        print(f"✅ Search properties: {total} results for LA, $100-500 "
+              f"({len(search_results)} on first page)")
 
         # Test get property details
         if properties:
@@ -106,8 +107,8 @@ def test_booking_service():
         print(f"✅ Get all bookings: {len(bookings)} bookings found")
 
         # Test get user bookings
-        user_bookings = booking_service.get_user_bookings(user_id=3)
-        print(f"✅ Get user bookings: {len(user_bookings)} bookings for user 3")
+        user_bookings, total = booking_service.get_user_bookings(user_id=3)
+        print(f"✅ Get user bookings: {total} bookings for user 3")
 
         # Test calculate price
         try:
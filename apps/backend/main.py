@@ -16,6 +16,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Dict, Any
 
 import logging
+from src.api import configure_threadpool, warm_data_indexes  # noqa: E402
+from utils.responses import DefaultJSONResponse  # noqa: E402
+from utils.request_cache import RequestCacheMiddleware  # noqa: E402
 from src.api.routes import houses, rooms, bookings, auth, users, reviews, wishlists, messages, notifications, payments
 from fastapi import APIRouter
 
@@ -50,9 +53,14 @@ app = FastAPI(
     version="1.0.0",
     description="A comprehensive Airbnb clone API with full functionality",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DefaultJSONResponse
 )
 
+# Raise the threadpool size used by sync route handlers
+app.add_event_handler("startup", configure_threadpool)
+app.add_event_handler("startup", warm_data_indexes)
+
 # Include main router
 app.include_router(main_router)
 
@@ -77,6 +85,9 @@ allowed_origins = [
     "http://localhost:5173",
 ]
 
+# Memoize repeated service reads within a request
+app.add_middleware(RequestCacheMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -84,6 +95,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "Deprecation"],
 )
 
 # For local development
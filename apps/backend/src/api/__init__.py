@@ -14,6 +14,8 @@ sys.path.insert(0, str(src_path))
 
 # Import settings and routes
 from config.settings import settings
+from utils.responses import DefaultJSONResponse  # noqa: E402
+from utils.request_cache import RequestCacheMiddleware  # noqa: E402
 from api.routes import houses, rooms, bookings, auth, users, reviews, wishlists, messages, notifications, payments
 
 # Configure logging
@@ -45,6 +47,52 @@ async def health_check():
     }
 
 
+@main_router.get("/debug/pool", include_in_schema=False)
+async def debug_pool():
+    """
+    Report usage of the threadpool that runs sync route handlers.
+
+    Handlers block on the file-backed services inside this pool, so a
+    borrowed count pinned at the total means requests are queueing.
+    """
+    if not settings.debug:
+        raise StarletteHTTPException(status_code=404)
+
+    from anyio import to_thread
+    limiter = to_thread.current_default_thread_limiter()
+    return {
+        "total": limiter.total_tokens,
+        "borrowed": limiter.borrowed_tokens,
+        "available": limiter.available_tokens,
+        "waiting": limiter.statistics().tasks_waiting
+    }
+
+
+def configure_threadpool(total_tokens: int=settings.threadpool_size):
+    """
+    Resize the threadpool Starlette uses for sync (def) route handlers.
+
+    Handlers that only call the blocking service layer are plain `def` so
+    they run off the event loop; this raises anyio's default of 40 threads.
+    """
+    from anyio import to_thread
+    to_thread.current_default_thread_limiter().total_tokens = total_tokens
+
+
+def warm_data_indexes():
+    """
+    Build the memoized property, review and wishlist id indexes before the first request.
+
+    Async handlers (e.g. geo, reviews, wishlists) look items up through these
+    indexes, so warming them keeps the initial JSON load off the event loop's
+    hot path.
+    """
+    from services import property_service, review_service, user_service
+    for service in (property_service, review_service):
+        service.data_manager.get_index(service.get_primary_file())
+    user_service.data_manager.get_index("wishlists.json")
+
+
 def create_app():
     app = FastAPI(
         title=settings.app_name,
@@ -52,7 +100,8 @@ def create_app():
         description="A comprehensive Airbnb clone API with full functionality",
         docs_url="/docs",
         redoc_url="/redoc",
-        debug=settings.debug
+        debug=settings.debug,
+        default_response_class=DefaultJSONResponse
     )
 
     # Log CORS configuration for debugging
@@ -60,6 +109,9 @@ def create_app():
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Debug mode: {settings.debug}")
 
+    # Memoize repeated service reads within a request
+    app.add_middleware(RequestCacheMiddleware)
+
     # Add CORS middleware using settings
     app.add_middleware(
         CORSMiddleware,
@@ -67,8 +119,13 @@ def create_app():
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"],
         allow_headers=["*"],
+        expose_headers=["X-Total-Count", "X-Next-Cursor", "Deprecation"],
     )
 
+    # The default thread limiter is bound to the running event loop
+    app.add_event_handler("startup", configure_threadpool)
+    app.add_event_handler("startup", warm_data_indexes)
+
     # Include main router
     app.include_router(main_router)
 
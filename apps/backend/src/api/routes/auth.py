@@ -30,7 +30,7 @@ INVALID_CREDENTIALS_MSG = "Could not validate credentials"
 
 
 @router.post("/register", response_model=AuthResponseSchema, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegisterSchema):
+def register(user_data: UserRegisterSchema):
     """
     Register a new user
 
@@ -73,7 +73,7 @@ async def register(user_data: UserRegisterSchema):
 
 
 @router.post("/login", response_model=TokenSchema)
-async def login(form_data: OAuth2PasswordRequestForm=Depends()):
+def login(form_data: OAuth2PasswordRequestForm=Depends()):
     """
     Login user and return access token
 
@@ -103,7 +103,7 @@ async def login(form_data: OAuth2PasswordRequestForm=Depends()):
 
 
 @router.post("/login/json", response_model=TokenSchema)
-async def login_json(user_data: UserLoginSchema):
+def login_json(user_data: UserLoginSchema):
     """
     Login user with JSON payload and return access token
 
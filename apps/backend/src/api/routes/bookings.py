@@ -1,13 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from typing import Annotated, List, Optional, Dict, Any
 
 # Import our service layer
 from services import booking_service, ServiceError, ValidationError, NotFoundError
-from auth.dependencies import get_current_active_user, get_current_user
-from schemas.booking import BookingCreate
+from auth.dependencies import get_current_active_user
+from schemas.booking import BookingStatus
 from schemas.booking_frontend import FrontendBookingCreate, BookingResponse
+from utils.cache import invalidate_cache
 
 router = APIRouter(
     prefix="/bookings",
@@ -16,10 +15,18 @@ router = APIRouter(
 )
 
 
+def _invalidate_availability(*bookings: dict[str, Any]) -> None:
+    """Drop cached calendar availability for the bookings' properties"""
+    property_ids = {booking.get("property_id", booking.get("room_id")) for booking in bookings}
+    property_ids.discard(None)
+    for property_id in property_ids:
+        invalidate_cache(f"avail:{property_id}:*")
+
+
 @router.get("/", response_model=List[Dict[str, Any]])
-async def get_bookings(
+def get_bookings(
     property_id: Optional[int]=None,
-    status: Optional[str]=None,
+    booking_status: Annotated[Optional[BookingStatus], Query(alias="status")]=None,
     page: int=1,
     limit: int=10,
     current_user: Dict[str, Any]=Depends(get_current_active_user)
@@ -31,8 +38,8 @@ async def get_bookings(
             filters["guest_id"] = current_user["id"]
         if property_id:
             filters["property_id"] = property_id
-        if status:
-            filters["status"] = status
+        if booking_status:
+            filters["status"] = booking_status
 
         skip = (page - 1) * limit
         return booking_service.get_all(skip=skip, limit=limit, filters=filters)
@@ -41,33 +48,33 @@ async def get_bookings(
 
 
 @router.get("/my-bookings", response_model=List[BookingResponse])
-async def get_my_bookings(
+def get_my_bookings(
+    response: Response,
     page: int=1,
     limit: int=10,
-    booking_status: Optional[str]=None,
+    booking_status: Optional[BookingStatus]=None,
     current_user: Dict[str, Any]=Depends(get_current_active_user)
 ):
     """Get current user's bookings (requires authentication)"""
     try:
         user_id = current_user["id"]
-        all_bookings = booking_service.get_user_bookings(
+        bookings, total = booking_service.get_user_bookings(
             user_id=user_id,
-            status=booking_status
+            status=booking_status,
+            skip=(page - 1) * limit,
+            limit=limit
         )
-        skip = (page - 1) * limit
-        return all_bookings[skip:skip + limit]
+        response.headers["X-Total-Count"] = str(total)
+        return bookings
     except ServiceError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.get("/{booking_id}", response_model=Dict[str, Any])
-async def get_booking(booking_id: int, current_user: Dict[str, Any]=Depends(get_current_active_user)):
+def get_booking(booking_id: int, current_user: dict[str, Any]=Depends(get_current_active_user)):
     """Get a specific booking by ID"""
     try:
-        booking = booking_service.get_by_id(booking_id)
-        if booking["guest_id"] != current_user["id"]:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this booking")
-        return booking
+        return booking_service.get_by_id_for_user(booking_id, current_user["id"])
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ServiceError as e:
@@ -75,15 +82,17 @@ async def get_booking(booking_id: int, current_user: Dict[str, Any]=Depends(get_
 
 
 @router.post("/", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
-async def create_booking(booking_data: FrontendBookingCreate, current_user: Dict[str, Any]=Depends(get_current_active_user)):
+def create_booking(booking_data: FrontendBookingCreate, current_user: dict[str, Any]=Depends(get_current_active_user)):
     """Create a new booking"""
     try:
         # Convert Pydantic model to dict
-        booking_dict = booking_data.dict()
+        booking_dict = booking_data.model_dump()
         # Add guest_id from current user
         booking_dict["guest_id"] = current_user["id"]
         # Create booking through service
-        return booking_service.create_booking(booking_dict)
+        booking = booking_service.create_booking(booking_dict)
+        _invalidate_availability(booking)
+        return booking
     except ValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except ServiceError as e:
@@ -91,10 +100,15 @@ async def create_booking(booking_data: FrontendBookingCreate, current_user: Dict
 
 
 @router.put("/{booking_id}", response_model=Dict[str, Any])
-async def update_booking(booking_id: int, updates: Dict[str, Any]):
+def update_booking(booking_id: int, updates: dict[str, Any]):
     """Update a booking"""
     try:
-        return booking_service.update(booking_id, updates)
+        # Copied because update modifies the stored booking in place
+        previous = dict(booking_service.get_by_id(booking_id))
+        booking = booking_service.update(booking_id, updates)
+        # Dates, status or property may have changed; clear both old and new
+        _invalidate_availability(previous, booking)
+        return booking
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValidationError as e:
@@ -104,10 +118,12 @@ async def update_booking(booking_id: int, updates: Dict[str, Any]):
 
 
 @router.post("/{booking_id}/confirm", response_model=Dict[str, Any])
-async def confirm_booking(booking_id: int):
+def confirm_booking(booking_id: int):
     """Confirm a pending booking"""
     try:
-        return booking_service.confirm_booking(booking_id)
+        booking = booking_service.confirm_booking(booking_id)
+        _invalidate_availability(booking)
+        return booking
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValidationError as e:
@@ -117,11 +133,13 @@ async def confirm_booking(booking_id: int):
 
 
 @router.post("/{booking_id}/cancel", response_model=Dict[str, Any])
-async def cancel_booking(booking_id: int, cancellation_data: Optional[Dict[str, Any]]=None):
+def cancel_booking(booking_id: int, cancellation_data: Optional[dict[str, Any]]=None):
     """Cancel a booking"""
     try:
         reason = cancellation_data.get("reason") if cancellation_data else None
-        return booking_service.cancel_booking(booking_id, reason)
+        booking = booking_service.cancel_booking(booking_id, reason)
+        _invalidate_availability(booking)
+        return booking
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValidationError as e:
@@ -131,24 +149,44 @@ async def cancel_booking(booking_id: int, cancellation_data: Optional[Dict[str,
 
 
 @router.get("/property/{property_id}", response_model=List[Dict[str, Any]])
-async def get_property_bookings(
+def get_property_bookings(
     property_id: int,
-    booking_status: Optional[str]=None,
-    page: int=1,
+    response: Response,
+    current_user: Annotated[dict[str, Any], Depends(get_current_active_user)],
+    booking_status: Optional[BookingStatus]=None,
+    page: Optional[int]=Query(None, ge=1, deprecated=True, description="Use after_id instead"),
+    after_id: Optional[int]=Query(None, description="Return bookings after this booking ID"),
     limit: int=20
 ):
-    """Get bookings for a specific property"""
+    """
+    Get bookings for a specific property (property host or admin only)
+
+    Paginate with `after_id`, passing the `X-Next-Cursor` header from the
+    previous page; `page` is kept for older clients.
+    """
     try:
-        bookings = booking_service.get_property_bookings(property_id, booking_status)
-        skip = (page - 1) * limit
-        end_idx = min(skip + limit, len(bookings))
-        return bookings[skip:end_idx]
+        bookings, total = booking_service.get_property_bookings(
+            property_id,
+            None if current_user.get("is_admin") else current_user["id"],
+            booking_status,
+            skip=((page or 1) - 1) * limit,
+            limit=limit,
+            after_id=after_id
+        )
+        response.headers["X-Total-Count"] = str(total)
+        if len(bookings) == limit:
+            response.headers["X-Next-Cursor"] = str(bookings[-1]["id"])
+        if page is not None and after_id is None:
+            response.headers["Deprecation"] = "true"
+        return bookings
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except ServiceError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.post("/calculate-price", response_model=Dict[str, Any])
-async def calculate_booking_price(booking_data: Dict[str, Any]):
+def calculate_booking_price(booking_data: dict[str, Any]):
     """Calculate total price for a booking"""
     try:
         total_price = booking_service.calculate_total_price(booking_data)
@@ -157,19 +195,3 @@ async def calculate_booking_price(booking_data: Dict[str, Any]):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except ServiceError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
-        property_data = property_dict.get(booking["property_id"], {})
-        result.append({
-            **booking,
-            "property": {
-                "id": property_data.get("id"),
-                "title": property_data.get("title"),
-                "property_type": property_data.get("property_type"),
-                "city": property_data.get("city"),
-                "state": property_data.get("state"),
-                "country": property_data.get("country"),
-                "image": property_data.get("images", [])[0] if property_data.get("images") else None
-            }
-        })
-
-    return result
-
@@ -1,18 +1,36 @@
 from fastapi import APIRouter, HTTPException, status, Query
-from typing import List, Dict, Any, Optional
-from datetime import datetime, date
+from typing import Annotated, Dict, Any, Optional
+from datetime import date
 
 # Import our service layer
-from services import property_service, booking_service, ServiceError, ValidationError, NotFoundError
-from utils.data_manager import properties_manager, bookings_manager
+from services import property_service, booking_service, ServiceError, NotFoundError
+from utils.cache import cache
+from schemas.calendar import DateRangeQuery
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
 
+# Weekend nights in the first `rem` nights of a stay starting on weekday `wd`
+_WEEKEND_REM = [
+    [sum((wd + i) % 7 >= 5 for i in range(rem)) for rem in range(7)]
+    for wd in range(7)
+]
+
+
+def _weekend_nights(start_weekday: int, nights: int) -> int:
+    """Count Saturday/Sunday nights in a stay without walking each day"""
+    full_weeks, rem = divmod(nights, 7)
+    return full_weeks * 2 + _WEEKEND_REM[start_weekday][rem]
+
+
 @router.get("/availability/{property_id}", response_model=Dict[str, Any])
-async def get_property_availability(
+@cache(
+    ttl=60,  # Bookings change this
+    key="avail:{property_id}:{dates.start_date}:{dates.end_date}",
+    min_execution_time=0
+)
+def get_property_availability(
     property_id: int,
-    start_date: str,
-    end_date: str
+    dates: Annotated[DateRangeQuery, Query()]
 ):
     """Get property availability for a specific date range"""
     try:
@@ -23,92 +41,56 @@ async def get_property_availability(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Property not found"
             )
-
-        # Check availability using booking service
-        is_available = booking_service.check_availability(
-            property_id=property_id,
-            check_in=start_date,
-            check_out=end_date
-        )
-
-        return {
-            "property_id": property_id,
-            "start_date": start_date,
-            "end_date": end_date,
-            "is_available": is_available,
-            "property_title": property_obj.get("title", "")
-        }
-
     except NotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Property not found"
         )
-    except ValidationError as e:
-        raise HTTPException(status_code=400, detail=str(e))
     except ServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Load existing bookings for this property
-    bookings = booking_service.get_all()
-    property_bookings = [b for b in bookings if b["property_id"] == property_id]
-
-    # Parse input dates
-    try:
-        start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-        end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid date format. Use ISO format (YYYY-MM-DD)."
-        )
-
-    # Generate all dates in range
-    date_range = []
-    current_date = start
-    while current_date <= end:
-        date_range.append(current_date.strftime("%Y-%m-%d"))
-        current_date += timedelta(days=1)
-
-    # Check which dates are available
-    availability = {}
-    for date in date_range:
-        # A date is unavailable if there's a booking that includes this date
-        is_available = True
-        for booking in property_bookings:
-            booking_start = datetime.fromisoformat(booking["check_in_date"].replace('Z', '+00:00'))
-            booking_end = datetime.fromisoformat(booking["check_out_date"].replace('Z', '+00:00'))
-
-            current_date = datetime.fromisoformat(date)
-            # Check if current date falls within a booking
-            if booking_start <= current_date < booking_end:
-                is_available = False
-                break
-
-        # Add availability status with price for the date
-        availability[date] = {
-            "available": is_available,
-            "base_price": property_obj["base_price"],
+    start_ord = dates.start_date.toordinal()
+    end_ord = dates.end_date.toordinal()
+
+    # Mark booked days with one pass per booking over its overlap with the range
+    span = end_ord - start_ord + 1
+    booked = [False] * max(span, 0)
+    intervals = booking_service.get_booked_intervals(property_id, start_ord, end_ord + 1)
+    for booking_start, booking_end in intervals:
+        lo = max(booking_start, start_ord) - start_ord
+        hi = min(booking_end, end_ord + 1) - start_ord
+        if lo < hi:
+            booked[lo:hi] = [True] * (hi - lo)
+
+    base_price = property_obj.get("base_price", property_obj.get("price"))
+    availability = {
+        date.fromordinal(start_ord + offset).isoformat(): {
+            "available": not is_booked,
+            "base_price": base_price,
             # In a real implementation, this might be different based on the date
             "special_price": None
         }
+        for offset, is_booked in enumerate(booked)
+    }
 
     return {
         "property_id": property_id,
+        "start_date": dates.start_date.isoformat(),
+        "end_date": dates.end_date.isoformat(),
+        "is_available": not any(booked),
+        "property_title": property_obj.get("title", ""),
         "availability": availability
     }
 
 @router.post("/block-dates/{property_id}", response_model=Dict[str, Any])
-async def block_property_dates(
+def block_property_dates(
     property_id: int,
-    start_date: str,
-    end_date: str,
+    dates: Annotated[DateRangeQuery, Query()],
     reason: Optional[str] = None
 ):
     """Block specific dates for a property (mock implementation)"""
     # Validate property exists
-    properties = property_service.get_all()
-    property_obj = next((p for p in properties if p["id"] == property_id), None)
+    property_obj = property_service.get_by_id_fast(property_id)
 
     if not property_obj:
         raise HTTPException(
@@ -121,22 +103,20 @@ async def block_property_dates(
 
     return {
         "property_id": property_id,
-        "start_date": start_date,
-        "end_date": end_date,
+        "start_date": dates.start_date.isoformat(),
+        "end_date": dates.end_date.isoformat(),
         "reason": reason,
         "message": "Dates blocked successfully (mock implementation)"
     }
 
 @router.post("/unblock-dates/{property_id}", response_model=Dict[str, Any])
-async def unblock_property_dates(
+def unblock_property_dates(
     property_id: int,
-    start_date: str,
-    end_date: str
+    dates: Annotated[DateRangeQuery, Query()]
 ):
     """Unblock specific dates for a property (mock implementation)"""
     # Validate property exists
-    properties = property_service.get_all()
-    property_obj = next((p for p in properties if p["id"] == property_id), None)
+    property_obj = property_service.get_by_id_fast(property_id)
 
     if not property_obj:
         raise HTTPException(
@@ -149,21 +129,24 @@ async def unblock_property_dates(
 
     return {
         "property_id": property_id,
-        "start_date": start_date,
-        "end_date": end_date,
+        "start_date": dates.start_date.isoformat(),
+        "end_date": dates.end_date.isoformat(),
         "message": "Dates unblocked successfully (mock implementation)"
     }
 
 @router.get("/pricing/{property_id}", response_model=Dict[str, Any])
-async def get_property_pricing(
+@cache(
+    ttl=600,
+    key="pricing:{property_id}:{dates.start_date}:{dates.end_date}",
+    min_execution_time=0
+)
+def get_property_pricing(
     property_id: int,
-    start_date: str,
-    end_date: str
+    dates: Annotated[DateRangeQuery, Query()]
 ):
     """Get property pricing for a specific date range"""
     # Validate property exists
-    properties = property_service.get_all()
-    property_obj = next((p for p in properties if p["id"] == property_id), None)
+    property_obj = property_service.get_by_id_fast(property_id)
 
     if not property_obj:
         raise HTTPException(
@@ -171,27 +154,12 @@ async def get_property_pricing(
             detail="Property not found"
         )
 
-    # Parse input dates
-    try:
-        start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-        end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid date format. Use ISO format (YYYY-MM-DD)."
-        )
-
-    # Calculate number of nights
-    nights = (end - start).days
-
-    if nights <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="End date must be after start date"
-        )
+    # Calculate number of nights (DateRangeQuery guarantees at least one)
+    nights = (dates.end_date - dates.start_date).days
 
     # Calculate base price
-    base_price_total = property_obj["base_price"] * nights
+    base_price = property_obj.get("base_price", property_obj.get("price", 0))
+    base_price_total = base_price * nights
 
     # Add cleaning fee and service fee
     cleaning_fee = property_obj.get("cleaning_fee", 0)
@@ -200,23 +168,18 @@ async def get_property_pricing(
     # In a real implementation, we might have dynamic pricing based on demand, seasons, etc.
     # For mock purposes, we'll use fixed rates with a simple weekend premium
 
-    # Check for weekends and apply premium
-    weekend_premium = 0
-    current_date = start
-    while current_date < end:
-        if current_date.weekday() >= 5:  # 5 and 6 are Saturday and Sunday
-            weekend_premium += property_obj["base_price"] * 0.2  # 20% premium on weekends
-        current_date += timedelta(days=1)
+    # Apply a 20% premium on Saturday and Sunday nights
+    weekend_premium = base_price * 0.2 * _weekend_nights(dates.start_date.weekday(), nights)
 
     # Calculate total
     total_price = base_price_total + cleaning_fee + service_fee + weekend_premium
 
     return {
         "property_id": property_id,
-        "start_date": start_date,
-        "end_date": end_date,
+        "start_date": dates.start_date.isoformat(),
+        "end_date": dates.end_date.isoformat(),
         "nights": nights,
-        "base_price_per_night": property_obj["base_price"],
+        "base_price_per_night": base_price,
         "base_price_total": base_price_total,
         "cleaning_fee": cleaning_fee,
         "service_fee": service_fee,
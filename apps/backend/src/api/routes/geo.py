@@ -1,23 +1,38 @@
 """
 Geolocation API routes for property locations and nearby attractions
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional, Dict, Any
-from ..services.geolocation import (
+import asyncio
+from enum import Enum
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query
+from typing import Annotated, List, Optional, Dict, Any
+from services.geolocation import (
     geocode_address, 
     get_place_details,
     find_nearby_places, 
     get_distance_matrix,
     get_coordinates_from_address
 )
-from ..auth.jwt import get_current_active_user
-from ..utils.cache import cache
+from auth.dependencies import get_current_active_user
+from utils.cache import cache
+from services import property_service
 
 router = APIRouter(prefix="/geo", tags=["geolocation"])
 
+class TravelMode(str, Enum):
+    """Travel modes supported by the distance matrix API"""
+    driving = "driving"
+    walking = "walking"
+    bicycling = "bicycling"
+    transit = "transit"
+
+
+# Limits for the batch nearby-places endpoint
+BATCH_NEARBY_MAX_PROPERTIES = 50
+BATCH_NEARBY_CONCURRENCY = 10  # Concurrent upstream Google Maps requests per batch
+
 
 @router.get("/geocode", response_model=Dict[str, Any])
-@cache(ttl=86400)  # Cache for 24 hours
+@cache(ttl=86400, key="geo:geocode:{address}")  # Cache for 24 hours
 async def geocode_location(
     address: str,
     current_user = Depends(get_current_active_user)
@@ -43,7 +58,7 @@ async def geocode_location(
 
 
 @router.get("/nearby", response_model=Dict[str, Any])
-@cache(ttl=3600)  # Cache for 1 hour
+@cache(ttl=3600, key="geo:nearby:{lat}:{lng}:{radius}:{place_type}")  # Cache for 1 hour
 async def get_nearby_places(
     lat: float,
     lng: float,
@@ -75,7 +90,7 @@ async def get_nearby_places(
 
 
 @router.get("/place/{place_id}", response_model=Dict[str, Any])
-@cache(ttl=86400)  # Cache for 24 hours
+@cache(ttl=86400, key="geo:place:{place_id}")  # Cache for 24 hours
 async def get_place_info(
     place_id: str,
     current_user = Depends(get_current_active_user)
@@ -101,11 +116,11 @@ async def get_place_info(
 
 
 @router.get("/distance", response_model=Dict[str, Any])
-@cache(ttl=86400)  # Cache for 24 hours
+@cache(ttl=86400, key="geo:distance:{origin}:{destination}:{mode.value}")  # Cache for 24 hours
 async def calculate_distance(
     origin: str,
     destination: str,
-    mode: str = Query("driving", regex="^(driving|walking|bicycling|transit)$"),
+    mode: TravelMode = TravelMode.driving,
     current_user = Depends(get_current_active_user)
 ):
     """
@@ -119,7 +134,7 @@ async def calculate_distance(
     Returns:
         Distance and duration information
     """
-    result = await get_distance_matrix([origin], [destination], mode)
+    result = await get_distance_matrix([origin], [destination], mode.value)
     
     if result.get("status") != "OK":
         raise HTTPException(
@@ -130,8 +145,41 @@ async def calculate_distance(
     return result
 
 
+async def _resolve_coordinates(
+    property_obj: dict[str, Any]
+) -> tuple[Optional[float], Optional[float]]:
+    """Get a property's coordinates, geocoding its address if they're missing"""
+    location = property_obj.get("location", {})
+    lat = location.get("lat")
+    lng = location.get("lng")
+
+    if not lat or not lng:
+        address = (
+            f"{location.get('address', '')}, {property_obj.get('city', '')}, "
+            f"{property_obj.get('state', '')}, {property_obj.get('country', '')}"
+        )
+        lat, lng = await get_coordinates_from_address(address)
+
+    return lat, lng
+
+
+def _property_summary(
+    property_id: int, property_obj: dict[str, Any], lat: float, lng: float
+) -> dict[str, Any]:
+    """Build the property block returned alongside nearby places"""
+    return {
+        "id": property_id,
+        "name": property_obj.get("property_name", property_obj.get("title_1")),
+        "address": property_obj.get("location", {}).get("address"),
+        "coordinates": {
+            "lat": lat,
+            "lng": lng
+        }
+    }
+
+
 @router.get("/property/{property_id}/nearby", response_model=Dict[str, Any])
-@cache(ttl=3600)  # Cache for 1 hour
+@cache(ttl=3600, key="geo:property:{property_id}:{radius}:{place_type}")  # Cache for 1 hour
 async def get_property_nearby_places(
     property_id: int,
     radius: int = Query(1500, ge=100, le=5000),
@@ -149,39 +197,21 @@ async def get_property_nearby_places(
     Returns:
         Nearby places results for the property
     """
-    # Load mock data for property
-    from pathlib import Path
-    import json
-    
-    base_dir = Path(__file__).parent.parent.parent
-    data_path = base_dir / "data" / "mock" / "properties.json"
-    
     try:
-        with open(data_path, "r") as f:
-            properties = json.load(f)
-            
-        property_obj = next((p for p in properties if p["id"] == property_id), None)
-        
+        property_obj = property_service.get_by_id_fast(property_id)
+
         if not property_obj:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Property not found"
             )
             
-        # Get coordinates
-        lat = property_obj.get("latitude")
-        lng = property_obj.get("longitude")
-        
-        # If coordinates not available, geocode the address
+        lat, lng = await _resolve_coordinates(property_obj)
         if not lat or not lng:
-            address = f"{property_obj['address']}, {property_obj['city']}, {property_obj['state']}, {property_obj['country']}"
-            lat, lng = await get_coordinates_from_address(address)
-            
-            if not lat or not lng:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Could not determine property coordinates"
-                )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Could not determine property coordinates"
+            )
         
         # Find nearby places
         result = await find_nearby_places(lat, lng, radius, place_type)
@@ -193,20 +223,75 @@ async def get_property_nearby_places(
             )
         
         return {
-            "property": {
-                "id": property_id,
-                "name": property_obj.get("title"),
-                "address": property_obj.get("address"),
-                "coordinates": {
-                    "lat": lat,
-                    "lng": lng
-                }
-            },
+            "property": _property_summary(property_id, property_obj, lat, lng),
             "nearby_places": result.get("results", [])
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get nearby places: {str(e)}"
         )
+
+
+@router.post("/property/batch-nearby", response_model=dict[str, Any])
+async def get_properties_nearby_places(
+    property_ids: Annotated[list[int], Body(embed=True)],
+    current_user: Annotated[dict[str, Any], Depends(get_current_active_user)],
+    radius: int = Query(1500, ge=100, le=5000),
+    place_type: Optional[str] = None
+):
+    """
+    Find nearby places for several properties at once (e.g. a map view)
+    
+    Lookups for different properties run concurrently, with at most
+    BATCH_NEARBY_CONCURRENCY upstream requests in flight at a time.
+    
+    Args:
+        property_ids: Property IDs (at most BATCH_NEARBY_MAX_PROPERTIES)
+        radius: Search radius in meters (100-5000)
+        place_type: Type of place to search for (restaurant, tourist_attraction, etc.)
+        
+    Returns:
+        Per-property nearby places results, in request order
+    """
+    if len(property_ids) > BATCH_NEARBY_MAX_PROPERTIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {BATCH_NEARBY_MAX_PROPERTIES} properties per request"
+        )
+
+    semaphore = asyncio.Semaphore(BATCH_NEARBY_CONCURRENCY)
+
+    async def lookup(property_id: int) -> dict[str, Any]:
+        property_obj = property_service.get_by_id_fast(property_id)
+        if not property_obj:
+            return {"property": {"id": property_id}, "error": "Property not found"}
+
+        async with semaphore:
+            lat, lng = await _resolve_coordinates(property_obj)
+            if not lat or not lng:
+                return {
+                    "property": {"id": property_id},
+                    "error": "Could not determine property coordinates"
+                }
+            result = await find_nearby_places(lat, lng, radius, place_type)
+
+        if result.get("status") != "OK":
+            return {
+                "property": _property_summary(property_id, property_obj, lat, lng),
+                "error": (
+                    "Nearby places search failed: "
+                    f"{result.get('error_message', 'Unknown error')}"
+                )
+            }
+
+        return {
+            "property": _property_summary(property_id, property_obj, lat, lng),
+            "nearby_places": result.get("results", [])
+        }
+
+    results = await asyncio.gather(*(lookup(property_id) for property_id in property_ids))
+    return {"results": results}
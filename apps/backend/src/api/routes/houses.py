@@ -1,37 +1,89 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from typing import Annotated, List, Optional, Dict, Any, Union
+from collections.abc import Iterator
+from types import MappingProxyType
+import hashlib
+import json
+import time
 
 from schemas.house import (
-    HouseResponse, HouseDetail, HouseSearch, HouseCreate, HouseUpdate
+    HouseResponse, HouseDetail, HouseSearch, HouseQuery, HouseCreate, HouseUpdate
 )
 
 # Import our service layer
 from services import property_service, user_service, ServiceError, ValidationError, NotFoundError
+from utils.cache import aget_cached_bytes, aset_cached_bytes, set_cached_bytes
+from utils.responses import DefaultJSONResponse
 
 router = APIRouter(prefix="/houses", tags=["houses"])
 
+# Serialized house list responses are cached under houses:list:* for this long
+HOUSES_LIST_CACHE_TTL = 300
 
-def transform_house_data(property_data: Dict) -> Dict:
-    """Transform JSON property data to house schema"""
-    # Handle location data
-    location = property_data.get("location", {})
+# In-process copies of full (limit=0) house list bodies, per cache key:
+# (stored_at, properties file version, total, body). Works without Redis.
+_ALL_HOUSES_CACHE: dict[str, tuple[float, Any, int, bytes]] = {}
+_ALL_HOUSES_CACHE_TTL = 60
+_ALL_HOUSES_CACHE_MAX_SIZE = 128
+
+# Query fields that change which houses are returned
+_HOUSE_FILTER_FIELDS = ("location", "property_type", "amenities", "instant_bookable")
+_HOUSE_ADAPTER = TypeAdapter(HouseResponse)
+
+# Memoized transform_house_data results keyed on (id, updated_at); cleared
+# whenever the properties file changes on disk. Cached dicts are shared.
+_TRANSFORM_CACHE: dict[tuple[Any, Any], dict] = {}
+_TRANSFORM_CACHE_MAX_SIZE = 10000
+_transform_cache_version = None
+
+# HouseResponse JSON per house id, so list responses are a join of
+# already-validated fragments; cleared together with _TRANSFORM_CACHE
+_HOUSE_JSON_CACHE: dict[int, bytes] = {}
 
-    # Handle availability
-    availability = property_data.get("availability", {})
+
+def _sync_transform_cache() -> None:
+    """Drop memoized house dicts if the properties file has changed"""
+    global _transform_cache_version
+    version = property_service.data_manager.version(property_service.get_primary_file())
+    if version != _transform_cache_version:
+        _TRANSFORM_CACHE.clear()
+        _HOUSE_JSON_CACHE.clear()
+        _transform_cache_version = version
+
+
+def transform_house_data(property_data: Dict) -> Dict:
+    """Transform JSON property data to house schema (memoized; don't mutate the result)"""
+    key = (property_data.get("id"), property_data.get("updated_at"))
+    house = _TRANSFORM_CACHE.get(key)
+    if house is None:
+        house = _build_house_data(property_data)
+        if len(_TRANSFORM_CACHE) < _TRANSFORM_CACHE_MAX_SIZE:
+            _TRANSFORM_CACHE[key] = house
+    return house
+
+
+def _build_house_data(property_data: dict) -> dict:
+    """Build the house schema dict from JSON property data"""
+    get = property_data.get
+    location = get("location", {})
+    availability = get("availability", {})
+    rating_count = get("rating_count", 0)
 
     return {
-        "id": int(property_data.get("id", 0)),
-        "title": property_data.get("property_name", property_data.get("title_1", "No Title")),
-        "description": property_data.get("description", ""),
-        "property_type": property_data.get("propertyType", "Unknown"),
+        "id": int(get("id", 0)),
+        "title": get("property_name", get("title_1", "No Title")),
+        "description": get("description", ""),
+        "property_type": get("propertyType", "Unknown"),
         "address": location.get("address", ""),
-        "city": property_data.get("city", ""),
-        "state": property_data.get("state", ""),
-        "country": property_data.get("country", ""),
-        "postal_code": property_data.get("postal_code", ""),
+        "city": get("city", ""),
+        "state": get("state", ""),
+        "country": get("country", ""),
+        "postal_code": get("postal_code", ""),
         "latitude": location.get("lat"),
         "longitude": location.get("lng"),
-        "amenities": property_data.get("amenities", []),
+        "amenities": get("amenities", []),
         "house_rules": "",
         "cancellation_policy": "flexible",
         "check_in_time": availability.get("checkInTime", "15:00"),
@@ -39,71 +91,170 @@ def transform_house_data(property_data: Dict) -> Dict:
         "minimum_stay": availability.get("minimumStay", 1),
         "maximum_stay": availability.get("maximumStay"),
         "is_instant_bookable": availability.get("instantBook", False),
-        "host_id": 1,  # Default host ID
+        "host_id": get("host_id", 1),  # Default host ID
         "is_active": True,
-        "images": property_data.get("images", []),
+        "images": get("images", []),
         "created_at": "2024-01-01T00:00:00",
         "updated_at": "2024-01-01T00:00:00",
         "total_rooms": 1,  # Most properties have 1 bookable unit
         # Additional fields for frontend display
-        "average_rating": property_data.get("rating", property_data.get("house_rating", 0)),
-        "total_reviews": property_data.get("rating_count", 0),
-        "total_bookings": property_data.get("rating_count", 0) * 2,
-        "is_new": property_data.get("is_new", False),
-        "is_guest_favorite": property_data.get("isGuestFavorite", False),
-        "filter": property_data.get("filter", ""),
-        "section": property_data.get("section", 1)
+        "average_rating": get("rating", get("house_rating", 0)),
+        "total_reviews": rating_count,
+        "total_bookings": rating_count * 2,
+        "is_new": get("is_new", False),
+        "is_guest_favorite": get("isGuestFavorite", False),
+        "filter": get("filter", ""),
+        "section": get("section", 1)
     }
 
 
-# Service functions
-def get_filtered_houses(filters: Dict[str, Any]) -> List[Dict]:
-    """Get houses with filters applied"""
-    try:
-        # Use property service for advanced search
-        search_params = {}
+# Host shown when a property has no host details and no matching user
+_DEFAULT_HOST = MappingProxyType({
+    "id": 1,
+    "first_name": "Unknown",
+    "last_name": "Host",
+    "profile_picture": "",
+    "is_verified": False
+})
 
-        if "location" in filters and filters["location"]:
-            # Split location into city/country for property service
-            location_parts = filters["location"].split(",")
-            if len(location_parts) >= 1:
-                search_params["city"] = location_parts[0].strip()
-            if len(location_parts) >= 2:
-                search_params["country"] = location_parts[1].strip()
 
-        if "property_type" in filters:
-            search_params["property_type"] = filters["property_type"]
+def transform_houses(properties: list[dict]) -> list[dict]:
+    """Transform a batch of properties, reusing memoized houses (don't mutate the results)"""
+    _sync_transform_cache()
+    cached = _TRANSFORM_CACHE.get
+    houses = [cached((p.get("id"), p.get("updated_at"))) for p in properties]
+    if None in houses:
+        houses = [
+            h if h is not None else transform_house_data(p)
+            for h, p in zip(houses, properties)
+        ]
+    return houses
 
-        if "min_price" in filters:
-            search_params["min_price"] = filters["min_price"]
 
-        if "max_price" in filters:
-            search_params["max_price"] = filters["max_price"]
+def _houses_list_cache_key(query: Union[HouseQuery, HouseSearch]) -> str:
+    """
+    Build the cache key for a house list query
 
-        if "min_guests" in filters:
-            search_params["min_guests"] = filters["min_guests"]
+    Hashes the filters together with the properties file version, so
+    entries for old data are never served after a write.
+    """
+    filters = {field: getattr(query, field) for field in _HOUSE_FILTER_FIELDS}
+    # Redis is shared between workers, so key on the file stat alone
+    filters["_version"] = property_service.data_manager.stat_version(
+        property_service.get_primary_file()
+    )
+    digest = hashlib.sha1(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()
+    return f"houses:list:{digest}:p{query.page}:l{query.limit}"
+
+
+def _house_json(house: dict) -> bytes:
+    """HouseResponse JSON for a transformed house, validated once per data version"""
+    body = _HOUSE_JSON_CACHE.get(house["id"])
+    if body is None:
+        body = _HOUSE_ADAPTER.dump_json(_HOUSE_ADAPTER.validate_python(house))
+        if len(_HOUSE_JSON_CACHE) < _TRANSFORM_CACHE_MAX_SIZE:
+            _HOUSE_JSON_CACHE[house["id"]] = body
+    return body
+
+
+async def _houses_list_response(cache_key: str, houses: list[dict], total: int) -> Response:
+    """Build the list body from per-house JSON fragments and cache it with the total"""
+    body = b"[" + b",".join([_house_json(h) for h in houses]) + b"]"
+    await aset_cached_bytes(cache_key, b"%d\n%s" % (total, body), HOUSES_LIST_CACHE_TTL)
+    return Response(content=body, media_type="application/json",
+                    headers={"X-Total-Count": str(total)})
+
+
+async def _cached_houses_list_response(cache_key: str) -> Optional[Response]:
+    """Rebuild a house list response from its cached total-prefixed entry"""
+    cached = await aget_cached_bytes(cache_key)
+    if cached is None:
+        return None
+    total, _, body = cached.partition(b"\n")
+    return Response(content=body, media_type="application/json",
+                    headers={"X-Total-Count": total.decode()})
+
+
+def _properties_version() -> Any:
+    """Current version stamp of the properties file"""
+    return property_service.data_manager.version(property_service.get_primary_file())
+
+
+def _all_houses_cached_response(cache_key: str) -> Optional[Response]:
+    """Serve a full house list from the in-process cache if it is fresh"""
+    entry = _ALL_HOUSES_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    stored_at, version, total, body = entry
+    if time.monotonic() - stored_at >= _ALL_HOUSES_CACHE_TTL or version != _properties_version():
+        return None
+    return Response(content=body, media_type="application/json",
+                    headers={"X-Total-Count": str(total)})
+
+
+def _houses_stream_response(cache_key: str, properties: Iterator[dict],
+                            total: int) -> StreamingResponse:
+    """Stream a house list item by item, caching the full body once it has been sent"""
+    version = _properties_version()
+
+    def body():
+        _sync_transform_cache()
+        fragments = []
+        yield b"["
+        for prop in properties:
+            fragment = _house_json(transform_house_data(prop))
+            yield fragment if not fragments else b"," + fragment
+            fragments.append(fragment)
+        yield b"]"
+        full_body = b"[" + b",".join(fragments) + b"]"
+        # Sync generator, iterated in the threadpool, so the blocking client is fine
+        set_cached_bytes(cache_key, b"%d\n%s" % (total, full_body), HOUSES_LIST_CACHE_TTL)
+        if len(_ALL_HOUSES_CACHE) >= _ALL_HOUSES_CACHE_MAX_SIZE:
+            _ALL_HOUSES_CACHE.clear()
+        _ALL_HOUSES_CACHE[cache_key] = (time.monotonic(), version, total, full_body)
+
+    return StreamingResponse(body(), media_type="application/json",
+                             headers={"X-Total-Count": str(total)})
 
-        # Get properties from service
-        properties = property_service.search_properties(**search_params)
 
-        # Transform properties to house schema
-        transformed_houses = [transform_house_data(p) for p in properties]
+# Service functions
+def _search_params(query: Union[HouseQuery, HouseSearch]) -> dict[str, Any]:
+    """Map house query filters onto property service search arguments"""
+    search_params = {"property_type": query.property_type}
+
+    if query.location:
+        # Split location into city/country for property service
+        location_parts = query.location.split(",")
+        search_params["city"] = location_parts[0].strip()
+        if len(location_parts) >= 2:
+            search_params["country"] = location_parts[1].strip()
 
-        return transformed_houses
+    return search_params
+
+
+def get_filtered_houses(query: Union[HouseQuery, HouseSearch], skip: int=0,
+                        limit: Optional[int]=None) -> tuple[list[dict], int]:
+    """Get a page of houses with filters applied, plus the total match count"""
+    try:
+        # Only the requested page is enriched and transformed
+        properties, total = property_service.search_properties(
+            skip=skip, limit=limit, **_search_params(query)
+        )
+
+        # Transform properties to house schema
+        return transform_houses(properties), total
 
     except ServiceError:
-        return []
+        return [], 0
 
 
-@router.get("/", response_model=List[HouseResponse], summary="Get house/property information")
-async def get_houses(
-    page: int=Query(1, ge=1, description="Page number (starts from 1)"),
-    limit: int=Query(20, ge=0, le=100, description="Number of houses per page (0 = return all)"),
-    location: Optional[str]=None,
-    property_type: Optional[str]=None,
-    amenities: Optional[List[str]]=Query(None),
-    instant_bookable: Optional[bool]=None
-):
+@router.get(
+    "/",
+    response_model=list[HouseResponse],
+    response_class=DefaultJSONResponse,
+    summary="Get house/property information"
+)
+async def get_houses(query: Annotated[HouseQuery, Query()]):
     """
     Get house/property information without room details.
 
@@ -122,46 +273,45 @@ async def get_houses(
     - **limit**: Number of houses per page (0 = return all houses)
     - Other parameters are filters for searching houses
     """
-    filters = {
-        "location": location,
-        "property_type": property_type,
-        "amenities": amenities,
-        "instant_bookable": instant_bookable
-    }
-
-    all_houses = get_filtered_houses(filters)
-
-    # If limit is 0, return all houses without pagination
-    if limit == 0:
-        return all_houses
-
-    # Apply pagination using page and limit
-    skip = (page - 1) * limit
-    end_idx = min(skip + limit, len(all_houses))
-    return all_houses[skip:end_idx]
-
-
-@router.get("/search", response_model=List[HouseResponse])
+    cache_key = _houses_list_cache_key(query)
+    cached = _all_houses_cached_response(cache_key) if query.limit == 0 else None
+    if cached is None:
+        cached = await _cached_houses_list_response(cache_key)
+    if cached is not None:
+        return cached
+
+    # If limit is 0, stream all houses without pagination
+    if query.limit == 0:
+        try:
+            properties, total = property_service.iter_search_properties(**_search_params(query))
+        except ServiceError:
+            properties, total = iter(()), 0
+        return _houses_stream_response(cache_key, properties, total)
+
+    skip = (query.page - 1) * query.limit
+    houses, total = get_filtered_houses(query, skip=skip, limit=query.limit)
+    return await _houses_list_response(cache_key, houses, total)
+
+
+@router.get("/search", response_model=list[HouseResponse], response_class=DefaultJSONResponse)
 async def search_houses(
     search_params: HouseSearch=Depends()
 ):
     """Advanced house search"""
-    filters = {
-        "location": search_params.location,
-        "property_type": search_params.property_type,
-        "amenities": search_params.amenities,
-        "instant_bookable": search_params.instant_bookable
-    }
-
-    all_houses = get_filtered_houses(filters)
+    cache_key = _houses_list_cache_key(search_params)
+    cached = await _cached_houses_list_response(cache_key)
+    if cached is not None:
+        return cached
 
-    # Apply pagination
-    skip = (search_params.page - 1) * search_params.limit
-    end_idx = min(skip + search_params.limit, len(all_houses))
-    return all_houses[skip:end_idx]
+    houses, total = get_filtered_houses(
+        search_params,
+        skip=(search_params.page - 1) * search_params.limit,
+        limit=search_params.limit
+    )
+    return await _houses_list_response(cache_key, houses, total)
 
 
-@router.get("/{house_id}", response_model=HouseDetail)
+@router.get("/{house_id}", response_model=HouseDetail, response_class=DefaultJSONResponse)
 async def get_house(house_id: int):
     """Get house by ID with host information and rooms"""
     try:
@@ -175,9 +325,8 @@ async def get_house(house_id: int):
             )
 
         # Transform to house schema
-        house_data = transform_house_data(house_obj)
-
-        return house_data
+        _sync_transform_cache()
+        transformed_house = transform_house_data(house_obj)
 
     except NotFoundError:
         raise HTTPException(
@@ -187,23 +336,19 @@ async def get_house(house_id: int):
     except ServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Transform house data
-    transformed_house = transform_house_data(house_obj)
-
     # Get host information
     host_info = house_obj.get("host", {})
-    if not host_info and users:
+    if not host_info:
         # Fallback to users data if available
-        for user in users:
-            if user["id"] == transformed_house["host_id"]:
-                host_info = {
-                    "id": user["id"],
-                    "first_name": user.get("first_name", "Unknown"),
-                    "last_name": user.get("last_name", "Host"),
-                    "profile_picture": user.get("profile_picture", ""),
-                    "is_verified": user.get("is_verified", False)
-                }
-                break
+        user = user_service.get_by_id_fast(transformed_house["host_id"])
+        if user:
+            host_info = {
+                "id": user["id"],
+                "first_name": user.get("first_name", "Unknown"),
+                "last_name": user.get("last_name", "Host"),
+                "profile_picture": user.get("profile_picture", ""),
+                "is_verified": user.get("is_verified", False)
+            }
 
     # Format host info properly
     if host_info and "name" in host_info:
@@ -215,14 +360,7 @@ async def get_house(house_id: int):
             "is_verified": host_info.get("isSuperhost", False)
         }
     elif not host_info:
-        # Default host info
-        host_info = {
-            "id": 1,
-            "first_name": "Unknown",
-            "last_name": "Host",
-            "profile_picture": "",
-            "is_verified": False
-        }
+        host_info = dict(_DEFAULT_HOST)
 
     # Create a default room for this house (for now, each house has one bookable unit)
     rooms = [{
@@ -245,12 +383,10 @@ async def get_house(house_id: int):
         "updated_at": transformed_house["updated_at"]
     }]
 
-    # Combine all the data
-    result = {
-        **transformed_house,
-        "host": host_info,
-        "rooms": rooms
-    }
+    # Combine all the data; transformed houses are memoized, so copy once before adding fields
+    result = dict(transformed_house)
+    result["host"] = host_info
+    result["rooms"] = rooms
 
     return result
 
@@ -292,33 +428,6 @@ async def get_house_rooms(house_id: int):
         )
     except ServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="House not found"
-        )
-
-    # For now, return one room per house (the entire property)
-    rooms = [{
-        "id": house_id,
-        "house_id": house_id,
-        "name": "Entire " + house_obj.get("propertyType", "Property"),
-        "room_type": house_obj.get("roomType", "Entire home/apt"),
-        "max_guests": house_obj.get("max_guests", 4),
-        "bedrooms": house_obj.get("bedrooms", 1),
-        "bathrooms": house_obj.get("bathrooms", 1),
-        "beds": house_obj.get("beds", 1),
-        "base_price": float(house_obj.get("price", 100)),
-        "cleaning_fee": 0.0,
-        "service_fee": 0.0,
-        "security_deposit": 0.0,
-        "room_amenities": [],
-        "is_available": True,
-        "images": house_obj.get("images", []),
-        "created_at": "2024-01-01T00:00:00",
-        "updated_at": "2024-01-01T00:00:00"
-    }]
-
-    return rooms
 
 
 # For mock data, simplified creation endpoints
@@ -337,7 +446,6 @@ async def get_my_houses():
     try:
         properties = property_service.get_all()[:3]  # Get first 3 for demo
         # Transform and return properties as houses
-        transformed_houses = [transform_house_data(p) for p in properties]
-        return transformed_houses
+        return transform_houses(properties)
     except ServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,85 +1,116 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import time
 
 # Import our service layer
 from services import communication_service, user_service, property_service, ServiceError, ValidationError, NotFoundError
+from utils.responses import DefaultJSONResponse
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
-
-@router.get("/conversations", response_model=List[Dict[str, Any]])
+# Constants
+USER_NOT_FOUND = "User not found"
+PROPERTY_NOT_FOUND = "Property not found"
+CONVERSATION_NOT_FOUND = "Conversation not found"
+
+# Mock conversations, built once at import; treat as read-only
+_MOCK_CONVERSATIONS = (
+    {
+        "id": 1,
+        "property_id": 2,
+        "host_id": 1,
+        "guest_id": 3,
+        "last_message": "Is the parking free?",
+        "last_message_time": "2025-08-10T14:23:15",
+        "unread_count": 1,
+        "created_at": "2025-08-10T10:15:30"
+    },
+    {
+        "id": 2,
+        "property_id": 5,
+        "host_id": 2,
+        "guest_id": 3,
+        "last_message": "Thanks for the information!",
+        "last_message_time": "2025-08-11T09:45:20",
+        "unread_count": 0,
+        "created_at": "2025-08-09T15:30:45"
+    },
+    {
+        "id": 3,
+        "property_id": 8,
+        "host_id": 4,
+        "guest_id": 3,
+        "last_message": "What time is check-in?",
+        "last_message_time": "2025-08-12T18:10:05",
+        "unread_count": 2,
+        "created_at": "2025-08-12T16:20:10"
+    }
+)
+_MOCK_CONVERSATIONS_BY_ID = {c["id"]: c for c in _MOCK_CONVERSATIONS}
+
+# Mock messages shown in every conversation as (sent by guest, message fields);
+# participant ids are filled in per request
+_MOCK_MESSAGE_TEMPLATES = (
+    (True, {
+        "id": 1,
+        "content": "Hi! I'm interested in your property.",
+        "created_at": "2025-08-10T10:15:30",
+        "read": True
+    }),
+    (False, {
+        "id": 2,
+        "content": "Hello! Thank you for your interest. Let me know if you have any questions.",
+        "created_at": "2025-08-10T10:30:45",
+        "read": True
+    }),
+    (True, {
+        "id": 3,
+        "content": "Is the parking free?",
+        "created_at": "2025-08-10T14:23:15",
+        "read": False
+    })
+)
+
+# Last formatted timestamp, reused for every call within the same second
+_ts_cache = {"t": 0, "s": ""}
+
+
+def now_iso() -> str:
+    """Current local time as an ISO string, at one-second resolution"""
+    t = int(time.time())
+    c = _ts_cache
+    if c["t"] != t:
+        c["s"] = datetime.fromtimestamp(t).isoformat()
+        c["t"] = t
+    return c["s"]
+
+
+@router.get(
+    "/conversations", response_model=List[Dict[str, Any]], response_class=DefaultJSONResponse
+)
 async def get_conversations(
     user_id: Optional[int]=None,
-        page: int=1,
+    page: int=1,
     limit: int=10
 ):
     """Get all conversations for a user"""
     try:
+        skip = (page - 1) * limit
         if user_id:
             # Validate user exists
             user = user_service.get_by_id(user_id)
             if not user:
-                raise HTTPException(status_code=404, detail="User not found")
+                raise HTTPException(status_code=404, detail=USER_NOT_FOUND)
 
-                skip = (page - 1) * limit
-                return communication_service.get_user_conversations(user_id, skip, limit)
-        else:
-                skip = (page - 1) * limit
-                return communication_service.get_all(skip, limit)
+            return communication_service.get_user_conversations(user_id, skip, limit)
+        return communication_service.get_all(skip, limit)
 
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ServiceError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    if user_id and not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=USER_NOT_FOUND
-        )
-
-    # Create mock conversations
-    mock_conversations = [
-        {
-            "id": 1,
-            "property_id": 2,
-            "host_id": 1,
-            "guest_id": 3,
-            "last_message": "Is the parking free?",
-            "last_message_time": "2025-08-10T14:23:15",
-            "unread_count": 1,
-            "created_at": "2025-08-10T10:15:30"
-        },
-        {
-            "id": 2,
-            "property_id": 5,
-            "host_id": 2,
-            "guest_id": 3,
-            "last_message": "Thanks for the information!",
-            "last_message_time": "2025-08-11T09:45:20",
-            "unread_count": 0,
-            "created_at": "2025-08-09T15:30:45"
-        },
-        {
-            "id": 3,
-            "property_id": 8,
-            "host_id": 4,
-            "guest_id": 3,
-            "last_message": "What time is check-in?",
-            "last_message_time": "2025-08-12T18:10:05",
-            "unread_count": 2,
-            "created_at": "2025-08-12T16:20:10"
-        }
-    ]
-
-    # Filter by user if specified
-    if user_id:
-        mock_conversations = [
-            c for c in mock_conversations
-            if c["host_id"] == user_id or c["guest_id"] == user_id
-        ]
-
 
 @router.post("/conversations", response_model=Dict[str, Any])
 async def create_conversation(conversation_data: Dict[str, Any]):
@@ -92,12 +123,11 @@ async def create_conversation(conversation_data: Dict[str, Any]):
         if not all([guest_id, host_id, property_id]):
             raise HTTPException(status_code=400, detail="Missing required fields")
 
-        # Validate entities exist
-        guest = user_service.get_by_id(guest_id)
-        host = user_service.get_by_id(host_id)
-        property_obj = property_service.get_property(property_id)
+        # Validate entities exist: both users come from one index lookup
+        users = user_service.get_many([guest_id, host_id])
+        property_obj = property_service.get_by_id_fast(property_id)
 
-        if not guest or not host or not property_obj:
+        if guest_id not in users or host_id not in users or not property_obj:
             raise HTTPException(status_code=404, detail="Referenced entity not found")
 
         # Create conversation using service
@@ -117,45 +147,14 @@ async def create_conversation(conversation_data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/conversations/{conversation_id}", response_model=Dict[str, Any])
+@router.get(
+    "/conversations/{conversation_id}",
+    response_model=Dict[str, Any],
+    response_class=DefaultJSONResponse
+)
 async def get_conversation(conversation_id: int):
     """Get a specific conversation"""
-    # Create mock conversations (same as above)
-    mock_conversations = [
-        {
-            "id": 1,
-            "property_id": 2,
-            "host_id": 1,
-            "guest_id": 3,
-            "last_message": "Is the parking free?",
-            "last_message_time": "2025-08-10T14:23:15",
-            "unread_count": 1,
-            "created_at": "2025-08-10T10:15:30"
-        },
-        {
-            "id": 2,
-            "property_id": 5,
-            "host_id": 2,
-            "guest_id": 3,
-            "last_message": "Thanks for the information!",
-            "last_message_time": "2025-08-11T09:45:20",
-            "unread_count": 0,
-            "created_at": "2025-08-09T15:30:45"
-        },
-        {
-            "id": 3,
-            "property_id": 8,
-            "host_id": 4,
-            "guest_id": 3,
-            "last_message": "What time is check-in?",
-            "last_message_time": "2025-08-12T18:10:05",
-            "unread_count": 2,
-            "created_at": "2025-08-12T16:20:10"
-        }
-    ]
-
-    # Find the conversation
-    conversation = next((c for c in mock_conversations if c["id"] == conversation_id), None)
+    conversation = _MOCK_CONVERSATIONS_BY_ID.get(conversation_id)
 
     if not conversation:
         raise HTTPException(
@@ -164,42 +163,21 @@ async def get_conversation(conversation_id: int):
         )
 
     # Enrich with property and user details
-    properties = property_service.get_all()
-    users = user_service.get_all()
-
-    property_data = next((p for p in properties if p["id"] == conversation["property_id"]), {})
-    host_data = next((u for u in users if u["id"] == conversation["host_id"]), {})
-    guest_data = next((u for u in users if u["id"] == conversation["guest_id"]), {})
+    property_data = property_service.get_by_id_fast(conversation["property_id"]) or {}
+    host_data = user_service.get_by_id_fast(conversation["host_id"]) or {}
+    guest_data = user_service.get_by_id_fast(conversation["guest_id"]) or {}
 
     # Create mock messages for this conversation
+    guest_id = conversation["guest_id"]
+    host_id = conversation["host_id"]
     mock_messages = [
         {
-            "id": 1,
-            "conversation_id": conversation_id,
-            "sender_id": conversation["guest_id"],
-            "receiver_id": conversation["host_id"],
-            "content": "Hi! I'm interested in your property.",
-            "created_at": "2025-08-10T10:15:30",
-            "read": True
-        },
-        {
-            "id": 2,
-            "conversation_id": conversation_id,
-            "sender_id": conversation["host_id"],
-            "receiver_id": conversation["guest_id"],
-            "content": "Hello! Thank you for your interest. Let me know if you have any questions.",
-            "created_at": "2025-08-10T10:30:45",
-            "read": True
-        },
-        {
-            "id": 3,
+            **template,
             "conversation_id": conversation_id,
-            "sender_id": conversation["guest_id"],
-            "receiver_id": conversation["host_id"],
-            "content": "Is the parking free?",
-            "created_at": "2025-08-10T14:23:15",
-            "read": False
+            "sender_id": guest_id if from_guest else host_id,
+            "receiver_id": host_id if from_guest else guest_id
         }
+        for from_guest, template in _MOCK_MESSAGE_TEMPLATES
     ]
 
     result = {
@@ -235,8 +213,7 @@ async def create_conversation(
 ):
     """Create a new conversation (mock implementation)"""
     # Validate property exists
-    properties = property_service.get_all()
-    property_data = next((p for p in properties if p["id"] == property_id), None)
+    property_data = property_service.get_by_id_fast(property_id)
 
     if not property_data:
         raise HTTPException(
@@ -244,9 +221,10 @@ async def create_conversation(
             detail=PROPERTY_NOT_FOUND
         )
 
-    # Validate users exist
-    users = user_service.get_all()
-    guest = next((u for u in users if u["id"] == guest_id), None)
+    # Validate users exist (guest and host in one lookup)
+    host_id = property_data.get("host_id")
+    users = user_service.get_many([guest_id, host_id])
+    guest = users.get(guest_id)
 
     if not guest:
         raise HTTPException(
@@ -254,8 +232,7 @@ async def create_conversation(
             detail=USER_NOT_FOUND
         )
 
-    host_id = property_data.get("host_id")
-    host = next((u for u in users if u["id"] == host_id), None)
+    host = users.get(host_id)
 
     if not host:
         raise HTTPException(
@@ -265,7 +242,7 @@ async def create_conversation(
 
     # In a real implementation, we would create a new conversation in the database
     # For mock purposes, we'll return a fake conversation
-    now = datetime.now().isoformat()
+    now = now_iso()
 
     new_conversation = {
         "id": 999,
@@ -317,42 +294,7 @@ async def send_message(
     content: str
 ):
     """Send a message in a conversation (mock implementation)"""
-    # Create mock conversations (same as above)
-    mock_conversations = [
-        {
-            "id": 1,
-            "property_id": 2,
-            "host_id": 1,
-            "guest_id": 3,
-            "last_message": "Is the parking free?",
-            "last_message_time": "2025-08-10T14:23:15",
-            "unread_count": 1,
-            "created_at": "2025-08-10T10:15:30"
-        },
-        {
-            "id": 2,
-            "property_id": 5,
-            "host_id": 2,
-            "guest_id": 3,
-            "last_message": "Thanks for the information!",
-            "last_message_time": "2025-08-11T09:45:20",
-            "unread_count": 0,
-            "created_at": "2025-08-09T15:30:45"
-        },
-        {
-            "id": 3,
-            "property_id": 8,
-            "host_id": 4,
-            "guest_id": 3,
-            "last_message": "What time is check-in?",
-            "last_message_time": "2025-08-12T18:10:05",
-            "unread_count": 2,
-            "created_at": "2025-08-12T16:20:10"
-        }
-    ]
-
-    # Find the conversation
-    conversation = next((c for c in mock_conversations if c["id"] == conversation_id), None)
+    conversation = _MOCK_CONVERSATIONS_BY_ID.get(conversation_id)
 
     if not conversation:
         raise HTTPException(
@@ -372,7 +314,7 @@ async def send_message(
 
     # In a real implementation, we would add the message to the database
     # For mock purposes, we'll return a fake message
-    now = datetime.now().isoformat()
+    now = now_iso()
 
     new_message = {
         "id": 999,
@@ -394,42 +336,7 @@ async def mark_conversation_as_read(
     user_id: int
 ):
     """Mark all messages in a conversation as read (mock implementation)"""
-    # Create mock conversations (same as above)
-    mock_conversations = [
-        {
-            "id": 1,
-            "property_id": 2,
-            "host_id": 1,
-            "guest_id": 3,
-            "last_message": "Is the parking free?",
-            "last_message_time": "2025-08-10T14:23:15",
-            "unread_count": 1,
-            "created_at": "2025-08-10T10:15:30"
-        },
-        {
-            "id": 2,
-            "property_id": 5,
-            "host_id": 2,
-            "guest_id": 3,
-            "last_message": "Thanks for the information!",
-            "last_message_time": "2025-08-11T09:45:20",
-            "unread_count": 0,
-            "created_at": "2025-08-09T15:30:45"
-        },
-        {
-            "id": 3,
-            "property_id": 8,
-            "host_id": 4,
-            "guest_id": 3,
-            "last_message": "What time is check-in?",
-            "last_message_time": "2025-08-12T18:10:05",
-            "unread_count": 2,
-            "created_at": "2025-08-12T16:20:10"
-        }
-    ]
-
-    # Find the conversation
-    conversation = next((c for c in mock_conversations if c["id"] == conversation_id), None)
+    conversation = _MOCK_CONVERSATIONS_BY_ID.get(conversation_id)
 
     if not conversation:
         raise HTTPException(
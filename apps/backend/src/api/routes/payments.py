@@ -5,8 +5,12 @@ import random
 
 # Import our service layer
 from services import payment_service, ServiceError, ValidationError, NotFoundError
+from schemas.payment import PaymentCreate
+from utils.responses import DefaultJSONResponse
 
-router = APIRouter(prefix="/payments", tags=["payments"])
+router = APIRouter(
+    prefix="/payments", tags=["payments"], default_response_class=DefaultJSONResponse
+)
 
 @router.get("/", response_model=List[Dict[str, Any]])
 async def get_payments():
@@ -17,24 +21,11 @@ async def get_payments():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/", response_model=Dict[str, Any])
-async def process_payment(payment_data: Dict[str, Any]):
+async def process_payment(payload: PaymentCreate):
     """Process payment"""
     try:
-        booking_id = payment_data.get("booking_id")
-        amount = payment_data.get("amount", 0)
-        payment_method = payment_data.get("payment_method", "card")
-
-        if not booking_id or amount <= 0:
-            raise HTTPException(status_code=400, detail="Invalid payment data")
-
-        # Process payment using service
-        result = payment_service.process_payment(
-            booking_id=booking_id,
-            amount=amount,
-            payment_method=payment_method
-        )
-
-        return result
+        # Required fields and a positive amount are enforced by PaymentCreate
+        return payment_service.process_payment(payload.model_dump())
 
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
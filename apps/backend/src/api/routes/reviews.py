@@ -1,6 +1,9 @@
 from fastapi import APIRouter, HTTPException, status
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from functools import lru_cache
+import re
 
 from services import (
     review_service,
@@ -8,81 +11,118 @@ from services import (
 )
 
 from schemas.review import (
-    PropertyReviewsSummary
+    PropertyReviewsSummary,
+    ReviewUpdate
 )
+from utils.responses import DefaultJSONResponse
 
-router = APIRouter(prefix="/reviews", tags=["reviews"])
+router = APIRouter(
+    prefix="/reviews", tags=["reviews"], default_response_class=DefaultJSONResponse
+)
+
+_MONTHS = {
+    'January': '01', 'February': '02', 'March': '03', 'April': '04',
+    'May': '05', 'June': '06', 'July': '07', 'August': '08',
+    'September': '09', 'October': '10', 'November': '11', 'December': '12'
+}
+_MONTH_RE = re.compile('|'.join(_MONTHS))
 
 
 def fix_date_format(date_string: str) -> str:
     """Fix malformed date strings to proper ISO format"""
-    if not date_string:
+    # Fast path for the well-formed "YYYY-MM-DDTHH:MM:SS[Z]" shape, skipping
+    # the replace/fromisoformat round trip; anything else gets the full check
+    if (
+        date_string
+        and len(date_string) >= 19
+        and date_string[4] == '-'
+        and date_string[7] == '-'
+        and date_string[10] == 'T'
+        and date_string[:4].isdigit()
+        and date_string.find('Z', 0, len(date_string) - 1) == -1
+    ):
+        return date_string
+
+    fixed_date = _fix_date_string(date_string) if date_string else None
+    if fixed_date is None:
         return datetime.now().isoformat() + "Z"
+    return fixed_date
+
+
+@lru_cache(maxsize=4096)
+def _fix_date_string(date_string: str) -> Optional[str]:
+    """Pure part of fix_date_format; None means the date can't be repaired"""
     try:
         datetime.fromisoformat(date_string.replace('Z', '+00:00'))
         return date_string
     except ValueError:
-        month_mapping = {
-            'January': '01', 'February': '02', 'March': '03', 'April': '04',
-            'May': '05', 'June': '06', 'July': '07', 'August': '08',
-            'September': '09', 'October': '10', 'November': '11', 'December': '12'
-        }
-        for month_name, month_num in month_mapping.items():
-            if month_name in date_string:
-                fixed_date = date_string.replace(f'-{month_name}-', f'-{month_num}-01T')
-                if '2024' in fixed_date and fixed_date.count('2024') > 1:
-                    parts = fixed_date.split('T')
-                    if len(parts) == 2:
-                        date_part = parts[0]
-                        time_part = parts[1]
-                        date_components = date_part.split('-')
-                        if len(date_components) >= 3:
-                            year = date_components[0]
-                            month = month_num
-                            day = '01'
-                            fixed_date = f"{year}-{month}-{day}T{time_part}"
-                return fixed_date
-        return datetime.now().isoformat() + "Z"
+        match = _MONTH_RE.search(date_string)
+        if match:
+            month_name = match.group()
+            month_num = _MONTHS[month_name]
+            fixed_date = date_string.replace(f'-{month_name}-', f'-{month_num}-01T')
+            if '2024' in fixed_date and fixed_date.count('2024') > 1:
+                parts = fixed_date.split('T')
+                if len(parts) == 2:
+                    date_part = parts[0]
+                    time_part = parts[1]
+                    date_components = date_part.split('-')
+                    if len(date_components) >= 3:
+                        year = date_components[0]
+                        month = month_num
+                        day = '01'
+                        fixed_date = f"{year}-{month}-{day}T{time_part}"
+            return fixed_date
+        return None
 
 
 def clean_review_data(review: Dict[str, Any]) -> Dict[str, Any]:
     """Clean review data to ensure proper format"""
-    cleaned_review = review.copy()
-
-    # Fix date fields
-    if 'created_at' in cleaned_review:
-        cleaned_review['created_at'] = fix_date_format(cleaned_review['created_at'])
-
-    if 'host_response_date' in cleaned_review and cleaned_review['host_response_date']:
-        cleaned_review['host_response_date'] = fix_date_format(cleaned_review['host_response_date'])
-
-    return cleaned_review
+    return clean_reviews((review,))[0]
+
+
+def clean_reviews(reviews: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Clean a batch of reviews in one pass; the input dicts are not modified"""
+    out = []
+    append = out.append
+    fx = fix_date_format
+    for r in reviews:
+        cleaned = {**r}
+        if 'created_at' in r:
+            cleaned['created_at'] = fx(r['created_at'])
+        host_response_date = r.get('host_response_date')
+        if host_response_date:
+            cleaned['host_response_date'] = fx(host_response_date)
+        append(cleaned)
+    return out
+
+
+RATING_FIELDS = (
+    "overall_rating", "cleanliness_rating", "accuracy_rating",
+    "communication_rating", "location_rating", "check_in_rating", "value_rating"
+)
 
 
 def calculate_average_ratings(reviews: List[Dict[str, Any]]) -> Dict[str, float]:
     """Calculate average ratings from a list of reviews"""
     if not reviews:
-        return {
-            "overall_rating": 0,
-            "cleanliness_rating": 0,
-            "accuracy_rating": 0,
-            "communication_rating": 0,
-            "location_rating": 0,
-            "check_in_rating": 0,
-            "value_rating": 0
-        }
-
-    rating_fields = [
-        "overall_rating", "cleanliness_rating", "accuracy_rating",
-        "communication_rating", "location_rating", "check_in_rating", "value_rating"
-    ]
+        return dict.fromkeys(RATING_FIELDS, 0)
 
-    averages = {}
-    for field in rating_fields:
-        total = sum(r.get(field, 0) for r in reviews)
-        averages[field] = round(total / len(reviews), 2)
+    # Accumulate every field in a single pass over the reviews
+    overall = cleanliness = accuracy = communication = location = check_in = value = 0
+    for r in reviews:
+        get = r.get
+        overall += get("overall_rating", 0)
+        cleanliness += get("cleanliness_rating", 0)
+        accuracy += get("accuracy_rating", 0)
+        communication += get("communication_rating", 0)
+        location += get("location_rating", 0)
+        check_in += get("check_in_rating", 0)
+        value += get("value_rating", 0)
 
-    return averages
+    count = len(reviews)
+    totals = (overall, cleanliness, accuracy, communication, location, check_in, value)
+    return {field: round(total / count, 2) for field, total in zip(RATING_FIELDS, totals)}
 
 
 @router.get("/", response_model=List[Dict[str, Any]])
@@ -94,7 +134,8 @@ def get_reviews(
 ):
     """Get all reviews with optional filtering"""
     # Use the service class for all review logic
-    return review_service.get_reviews(property_id=property_id, guest_id=guest_id, page=page, limit=limit)
+    reviews = review_service.get_reviews(property_id=property_id, guest_id=guest_id, page=page, limit=limit)
+    return clean_reviews(reviews)
 
 
 @router.get("/property/{property_id}", response_model=Dict[str, Any])
@@ -108,51 +149,30 @@ def get_property_reviews(
 
 
 @router.get("/{review_id}", response_model=Dict[str, Any])
-def get_review(review_id: int):
+async def get_review(review_id: int):
     """Get review by ID"""
-    return review_service.get_review_by_id(review_id)
+    # Served from the memoized id index, which is warmed at startup, so
+    # this doesn't block the event loop on file I/O
+    review = review_service.get_by_id_fast(review_id)
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+    return clean_review_data(review)
 
 
 @router.put("/{review_id}", response_model=Dict[str, Any])
-async def update_review(
-    review_id: int,
-    overall_rating: Optional[float]=None,
-    cleanliness_rating: Optional[float]=None,
-    accuracy_rating: Optional[float]=None,
-    communication_rating: Optional[float]=None,
-    location_rating: Optional[float]=None,
-    check_in_rating: Optional[float]=None,
-    value_rating: Optional[float]=None,
-    comment: Optional[str]=None,
-    private_comment: Optional[str]=None
-):
+async def update_review(review_id: int, payload: ReviewUpdate):
     """Update a review (mock implementation)"""
-    reviews = review_service.get_all()
-    for review in reviews:
-        if review["id"] == review_id:
-            updated_review = {**review}
-            if overall_rating is not None:
-                updated_review["overall_rating"] = overall_rating
-            if cleanliness_rating is not None:
-                updated_review["cleanliness_rating"] = cleanliness_rating
-            if accuracy_rating is not None:
-                updated_review["accuracy_rating"] = accuracy_rating
-            if communication_rating is not None:
-                updated_review["communication_rating"] = communication_rating
-            if location_rating is not None:
-                updated_review["location_rating"] = location_rating
-            if check_in_rating is not None:
-                updated_review["check_in_rating"] = check_in_rating
-            if value_rating is not None:
-                updated_review["value_rating"] = value_rating
-            if comment is not None:
-                updated_review["comment"] = comment
-            if private_comment is not None:
-                updated_review["private_comment"] = private_comment
-            updated_review["updated_at"] = datetime.now().isoformat()
-            updated_review["message"] = "Review updated successfully (mock implementation)"
-            return updated_review
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="Review not found"
-    )
+    review = review_service.get_by_id_fast(review_id)
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+
+    updated_review = {**review, **payload.model_dump(exclude_unset=True)}
+    updated_review["updated_at"] = datetime.now(timezone.utc).isoformat()
+    updated_review["message"] = "Review updated successfully (mock implementation)"
+    return updated_review
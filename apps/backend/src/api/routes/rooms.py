@@ -1,5 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional, Dict, Any
+import hashlib
+import json
+import logging
 
 from schemas.room import (
     RoomResponse, RoomDetail, RoomSearch, RoomCreate, RoomUpdate, RoomListing
@@ -8,15 +12,91 @@ from schemas.room import (
 # Import our service layer
 from services.room_service import RoomService
 from services import user_service, ServiceError, ValidationError, NotFoundError
+from utils.cache import aget_cached_bytes, aset_cached_bytes, invalidate_cache
+from utils.responses import DefaultJSONResponse
 
 # Create service instance
 room_service = RoomService()
 import datetime
 
-router = APIRouter(prefix="/rooms", tags=["rooms"])
+router = APIRouter(
+    prefix="/rooms", tags=["rooms"], default_response_class=DefaultJSONResponse
+)
+
+logger = logging.getLogger(__name__)
 
 # Constants
-DEFAULT_TIMESTAMP = datetime.datetime.now().isoformat() + "Z"
+# Shared by reference by every transformed room; UTC, since it carries a "Z"
+DEFAULT_TIMESTAMP = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+
+# Room list/search responses are cached under rooms:* for this long
+ROOMS_CACHE_TTL = 60
+
+_ROOM_LISTING_ADAPTER = TypeAdapter(RoomListing)
+
+# transform_to_room_listing output per room id for the current rooms file version,
+# plus per listing id: amenities as a frozenset for subset tests, the
+# lowercased city/state/country joined by newlines for location matching, and
+# (listing, RoomListing JSON) so each listing is validated once per version
+_TRANSFORMED_CACHE: dict[str, Any] = {
+    "version": None, "data": {}, "amenities": {}, "locations": {}, "json": {}
+}
+
+# Location suggestions (sorted by relevance) for the current rooms file version,
+# with each one's lowercased "full\ncity\nstate\ncountry" text and a trigram
+# index (trigram -> ascending positions in data) over those texts
+_LOCATIONS_CACHE: dict[str, Any] = {"version": None, "data": [], "texts": [], "trigrams": {}}
+
+# Relevance rank of each location suggestion type
+_LOCATION_TYPE_ORDER = {"address": 1, "city": 2, "state": 3, "country": 4}
+
+
+def _rooms_version() -> Any:
+    """Current version stamp of the rooms file"""
+    return room_service.data_manager.version(room_service.get_primary_file())
+
+
+def _rooms_cache_key(endpoint: str, params: dict[str, Any]) -> str:
+    """
+    Build the cache key for a room list query
+
+    Hashes the query parameters together with the rooms file version, so
+    entries for old data are never served after a write.
+    """
+    params = {
+        name: value.model_dump() if isinstance(value, BaseModel) else value
+        for name, value in params.items()
+    }
+    # Redis is shared between workers, so key on the file stat alone
+    params["_version"] = room_service.data_manager.stat_version(room_service.get_primary_file())
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    return f"rooms:{endpoint}:{digest}"
+
+
+def _room_json(listing: dict) -> bytes:
+    """RoomListing JSON for a memoized listing, validated once per data version"""
+    memo = _TRANSFORMED_CACHE["json"]
+    entry = memo.get(listing["id"])
+    if entry is None or entry[0] is not listing:
+        entry = memo[listing["id"]] = (
+            listing, _ROOM_LISTING_ADAPTER.dump_json(_ROOM_LISTING_ADAPTER.validate_python(listing))
+        )
+    return entry[1]
+
+
+async def _rooms_list_response(cache_key: str, rooms: list[dict]) -> Response:
+    """Build a room list body from per-listing JSON fragments and cache it"""
+    body = b"[" + b",".join([_room_json(r) for r in rooms]) + b"]"
+    await aset_cached_bytes(cache_key, body, ROOMS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
+
+
+async def _cached_rooms_list_response(cache_key: str) -> Optional[Response]:
+    """Serve a cached room list body, if there is one"""
+    cached = await aget_cached_bytes(cache_key)
+    if cached is None:
+        return None
+    return Response(content=cached, media_type="application/json")
 
 
 def transform_room_data(property_data: Dict) -> Dict:
@@ -67,143 +147,180 @@ def transform_room_data(property_data: Dict) -> Dict:
 
 def transform_to_room_listing(property_data: Dict) -> Dict:
     """Transform to RoomListing format for frontend compatibility"""
-    location = property_data.get("location", {})
-    guest_capacity = property_data.get("guestCapacity", {})
-    max_guests = property_data.get("max_guests") or guest_capacity.get("adults", 2)
-    availability = property_data.get("availability", {})
+    get = property_data.get
+    location = get("location", {})
+    guest_capacity = get("guestCapacity", {})
+    max_guests = get("max_guests") or guest_capacity.get("adults", 2)
+    availability = get("availability", {})
+    # Each used for two output fields
+    room_id = int(get("id", 0))
+    rating = get("rating", get("house_rating", 0))
+    rating_count = get("rating_count", 0)
 
     return {
-        "id": int(property_data.get("id", 0)),
-        "title": property_data.get("property_name", property_data.get("title_1", "No Title")),
-        "description": property_data.get("description", ""),
-        "property_type": property_data.get("propertyType", "Unknown"),
-        "room_type": property_data.get("roomType", "Entire home/apt"),
+        "id": room_id,
+        "title": get("property_name", get("title_1", "No Title")),
+        "description": get("description", ""),
+        "property_type": get("propertyType", "Unknown"),
+        "room_type": get("roomType", "Entire home/apt"),
         "max_guests": max_guests,
-        "bedrooms": property_data.get("bedrooms", 1),
-        "bathrooms": float(property_data.get("bathrooms", 1)),
-        "beds": property_data.get("beds", 1),
+        "bedrooms": get("bedrooms", 1),
+        "bathrooms": float(get("bathrooms", 1)),
+        "beds": get("beds", 1),
         "address": location.get("address", ""),
-        "city": property_data.get("city", ""),
-        "state": property_data.get("state", ""),
-        "country": property_data.get("country", ""),
-        "postal_code": property_data.get("postal_code", ""),
+        "city": get("city", ""),
+        "state": get("state", ""),
+        "country": get("country", ""),
+        "postal_code": get("postal_code", ""),
         "latitude": location.get("lat"),
         "longitude": location.get("lng"),
-        "base_price": float(property_data.get("price", 0)),
+        "base_price": float(get("price", 0)),
         "cleaning_fee": 0.0,
         "service_fee": 0.0,
         "security_deposit": 0.0,
-        "amenities": property_data.get("amenities", []),
+        "amenities": get("amenities", []),
         "house_rules": "",
         "cancellation_policy": "flexible",
         "check_in_time": availability.get("checkInTime", "15:00"),
         "check_out_time": availability.get("checkOutTime", "11:00"),
         "is_instant_bookable": availability.get("instantBook", False),
-        "host_id": 1,  # Default host ID
+        "host_id": get("host_id", 1),  # Default host ID
         "is_active": True,
-        "images": property_data.get("images", []),
+        "images": get("images", []),
         "created_at": DEFAULT_TIMESTAMP,
         "updated_at": DEFAULT_TIMESTAMP,
         "host": None,  # Will be populated separately if needed
-        "average_rating": property_data.get("rating", property_data.get("house_rating", 0)),
-        "total_reviews": property_data.get("rating_count", 0),
-        "total_bookings": property_data.get("rating_count", 0) * 2,
+        "average_rating": rating,
+        "total_reviews": rating_count,
+        "total_bookings": rating_count * 2,
         # Additional fields for frontend compatibility
-        "rating": property_data.get("rating", property_data.get("house_rating", 0)),
-        "is_new": property_data.get("is_new", False),
-        "is_guest_favorite": property_data.get("isGuestFavorite", False),
-        "filter": property_data.get("filter", ""),
-        "section": property_data.get("section", 1),
-        "house_id": int(property_data.get("id", 0))
+        "rating": rating,
+        "is_new": get("is_new", False),
+        "is_guest_favorite": get("isGuestFavorite", False),
+        "filter": get("filter", ""),
+        "section": get("section", 1),
+        "house_id": room_id
     }
 
 
-# Mock data access functions
-def get_filtered_rooms(filters: Dict[str, Any]) -> List[Dict]:
-    """Get rooms with filters applied"""
-    properties = room_service.get_all()
+def _room_listings(properties: list[dict]) -> list[dict]:
+    """
+    Room listings for properties, reusing earlier transforms of the same data
+
+    The memo is dropped whenever the rooms file version changes. Listings
+    are shared between requests, so treat them as read-only.
+    """
+    version = _rooms_version()
+    if _TRANSFORMED_CACHE["version"] != version:
+        _TRANSFORMED_CACHE["version"] = version
+        _TRANSFORMED_CACHE["data"] = {}
+        _TRANSFORMED_CACHE["amenities"] = {}
+        _TRANSFORMED_CACHE["locations"] = {}
+        _TRANSFORMED_CACHE["json"] = {}
+    memo = _TRANSFORMED_CACHE["data"]
+    amenity_sets = _TRANSFORMED_CACHE["amenities"]
+    location_blobs = _TRANSFORMED_CACHE["locations"]
+
+    listings = []
+    for p in properties:
+        key = p.get("id")
+        listing = memo.get(key)
+        if listing is None:
+            listing = memo[key] = transform_to_room_listing(p)
+            # Amenities stored as a JSON string get no set; the filter falls back to `in`
+            if isinstance(listing["amenities"], list):
+                amenity_sets[listing["id"]] = frozenset(listing["amenities"])
+            location_blobs[listing["id"]] = "\n".join(
+                (listing["city"] or "", listing["state"] or "", listing["country"] or "")
+            ).lower()
+        listings.append(listing)
+    return listings
 
-    # Transform properties to room listings for frontend compatibility
-    transformed_rooms = [transform_to_room_listing(p) for p in properties]
-    filtered_rooms = transformed_rooms
 
-    # Geographic bounds filtering (map-based search)
+# Mock data access functions
+def get_filtered_rooms(filters: dict[str, Any], skip: int=0,
+                       limit: Optional[int]=None) -> list[dict]:
+    """Get one page of rooms with filters applied (limit=None returns all matches)"""
+    # Geographic bounds filtering (map-based search): only rooms inside the
+    # viewport are looked up and transformed
     if all(key in filters and filters[key] is not None for key in ["ne_lat", "ne_lng", "sw_lat", "sw_lng"]):
-        ne_lat, ne_lng = filters["ne_lat"], filters["ne_lng"]
-        sw_lat, sw_lng = filters["sw_lat"], filters["sw_lng"]
-
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if r.get("latitude") is not None and r.get("longitude") is not None and
-               sw_lat <= r["latitude"] <= ne_lat and
-               sw_lng <= r["longitude"] <= ne_lng
-        ]
-
-    if "location" in filters and filters["location"]:
-        location = filters["location"].lower()
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if (r["city"] and location in r["city"].lower()) or
-               (r["state"] and location in r["state"].lower()) or
-               (r["country"] and location in r["country"].lower())
-        ]
-
-    if "min_price" in filters and filters["min_price"] is not None:
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if r["base_price"] >= filters["min_price"]
-        ]
-
-    if "max_price" in filters and filters["max_price"] is not None:
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if r["base_price"] <= filters["max_price"]
-        ]
-
-    if "room_type" in filters and filters["room_type"]:
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if r["room_type"] == filters["room_type"]
-        ]
-
-    if "guests" in filters and filters["guests"]:
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if r["max_guests"] >= filters["guests"]
-        ]
-
-    if "house_id" in filters and filters["house_id"]:
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if r["house_id"] == filters["house_id"]
-        ]
-
-    if "amenities" in filters and filters["amenities"]:
-        filtered_rooms = [
-            r for r in filtered_rooms
-            if all(amenity in r["amenities"] for amenity in filters["amenities"])
-        ]
-
-    # Only return active rooms
-    filtered_rooms = [r for r in filtered_rooms if r.get("is_active", True)]
+        properties = room_service.get_rooms_in_bounds(
+            filters["sw_lat"], filters["sw_lng"], filters["ne_lat"], filters["ne_lng"]
+        )
+    else:
+        properties = room_service.get_all()
 
-    return filtered_rooms
+    # Every other filter is checked in one pass; unset filters are None
+    location = filters.get("location")
+    location = location.lower() if location else None
+    min_price = filters.get("min_price")
+    max_price = filters.get("max_price")
+    room_type = filters.get("room_type") or None
+    guests = filters.get("guests") or None
+    house_id = filters.get("house_id") or None
+    amenities = filters.get("amenities") or None
+
+    # With no per-room predicates every room matches (listings are always
+    # active), so only the requested page needs transforming
+    if (location is None and min_price is None and max_price is None and room_type is None
+            and guests is None and house_id is None and amenities is None):
+        end = None if limit is None else skip + limit
+        return _room_listings(properties[skip:end])
 
+    # Transform properties to room listings for frontend compatibility
+    rooms = _room_listings(properties)
+
+    required_amenities = frozenset(amenities) if amenities is not None else None
+    amenity_sets = _TRANSFORMED_CACHE["amenities"]
+    location_blobs = _TRANSFORMED_CACHE["locations"]
+
+    # Matches before `skip` are only counted, and the scan stops once the page is full
+    filtered_rooms = []
+    append = filtered_rooms.append
+    to_skip = skip
+    for r in rooms:
+        if location is not None and location not in location_blobs[r["id"]]:
+            continue
+        if min_price is not None and r["base_price"] < min_price:
+            continue
+        if max_price is not None and r["base_price"] > max_price:
+            continue
+        if room_type is not None and r["room_type"] != room_type:
+            continue
+        if guests is not None and r["max_guests"] < guests:
+            continue
+        if house_id is not None and r["house_id"] != house_id:
+            continue
+        if amenities is not None:
+            amenity_set = amenity_sets.get(r["id"])
+            if amenity_set is not None:
+                if not required_amenities.issubset(amenity_set):
+                    continue
+            elif not all(amenity in r["amenities"] for amenity in amenities):
+                continue
+        # Only return active rooms
+        if not r.get("is_active", True):
+            continue
+        if to_skip:
+            to_skip -= 1
+            continue
+        append(r)
+        if len(filtered_rooms) == limit:
+            break
 
-def get_search_rooms(filters: Dict[str, Any]) -> List[Dict]:
-    """Get rooms with filters applied"""
-    properties = room_service.search_properties(filters)
+    return filtered_rooms
 
-    # Transform properties to room listings for frontend compatibility
-    transformed_rooms = [transform_to_room_listing(p) for p in properties]
-    filtered_rooms = transformed_rooms
 
-    # Only return active rooms
-    filtered_rooms = [r for r in filtered_rooms if r.get("is_active", True)]
-    if len(filtered_rooms) == 0:
-        filtered_rooms = get_filtered_rooms(filters)
+def get_search_rooms(filters: dict[str, Any], skip: int=0, limit: Optional[int]=None) -> list[dict]:
+    """Get one page of rooms with filters applied (limit=None returns all matches)"""
+    properties = room_service.search_properties(filters)
+    if not properties:
+        return get_filtered_rooms(filters, skip, limit)
 
-    return filtered_rooms
+    # Transform only the requested page to room listings for frontend
+    # compatibility (listings are always active, so nothing is dropped after slicing)
+    end = None if limit is None else skip + limit
+    return _room_listings(properties[skip:end])
 
 
 @router.get("/", response_model=List[RoomListing], summary="Get bookable rooms with house context")
@@ -256,17 +373,21 @@ async def get_rooms(
         "search_by_map": search_by_map
     }
 
-    all_rooms = get_search_rooms(filters)
+    cache_key = _rooms_cache_key("list", {**filters, "page": page, "limit": limit})
+    cached = await _cached_rooms_list_response(cache_key)
+    if cached is not None:
+        return cached
 
     # If limit is 0, return all rooms without pagination
     if limit == 0:
-        return all_rooms
+        rooms = get_search_rooms(filters)
+    else:
+        # Apply pagination using page and limit
+        rooms = get_search_rooms(filters, skip=(page - 1) * limit, limit=limit)
 
-    # Apply pagination using page and limit
-    skip = (page - 1) * limit
-    end_idx = min(skip + limit, len(all_rooms))
-
-    return all_rooms[skip:end_idx]
+    # Listings are built in-process with the RoomListing shape and validated
+    # once per data version in _room_json, so skip per-request validation
+    return await _rooms_list_response(cache_key, rooms)
 
 
 @router.get("/search", response_model=List[RoomListing])
@@ -319,17 +440,104 @@ async def search_rooms(
         "max_stay_days": search_params.max_stay_days
     }
 
-    all_rooms = get_search_rooms(filters)
+    cache_key = _rooms_cache_key("search", {"search_params": search_params})
+    cached = await _cached_rooms_list_response(cache_key)
+    if cached is not None:
+        return cached
 
     # If limit is 0, return all rooms without pagination
     if search_params.limit == 0:
-        return all_rooms
+        rooms = get_search_rooms(filters)
+    else:
+        # Apply pagination
+        skip = (search_params.page - 1) * search_params.limit
+        rooms = get_search_rooms(filters, skip=skip, limit=search_params.limit)
 
-    # Apply pagination
-    skip = (search_params.page - 1) * search_params.limit
-    end_idx = min(skip + search_params.limit, len(all_rooms))
+    return await _rooms_list_response(cache_key, rooms)
 
-    return all_rooms[skip:end_idx]
+
+def _location_index() -> dict[str, Any]:
+    """
+    All location suggestions sorted by relevance, with their search index
+
+    Independent of the search query, so it is built once per rooms file
+    version and each request only filters it. Treat the result as read-only.
+    """
+    version = _rooms_version()
+    if _LOCATIONS_CACHE["data"] and _LOCATIONS_CACHE["version"] == version:
+        return _LOCATIONS_CACHE
+
+    properties = room_service.get_all()
+
+    # Extract unique locations
+    locations = set()
+    add = locations.add
+
+    for prop in properties:
+        city = prop.get("city", "").strip()
+        state = prop.get("state", "").strip()
+        country = prop.get("country", "").strip()
+
+        # Get address from location object or direct field
+        location_obj = prop.get("location", {})
+        address = ""
+        if isinstance(location_obj, dict):
+            address = location_obj.get("address", "").strip()
+        if not address:
+            address = prop.get("address", "").strip()
+
+        # Every suggestion needs a country
+        if not country:
+            continue
+
+        # Add address-level locations (most specific), only if the first part
+        # of the address is different from city (avoid duplication like "Miami, Miami, FL")
+        if address and city and address.split(',', 1)[0].strip().lower() != city.lower():
+            add((f"{address}, {country}", city, state, country, "address"))
+
+        # Add city-level locations
+        if city:
+            city_str = f"{city}, {state}, {country}" if state else f"{city}, {country}"
+            add((city_str, city, state, country, "city"))
+
+        # Add state-level location if available
+        if state:
+            add((f"{state}, {country}", "", state, country, "state"))
+
+        # Add country-level location
+        add((country, "", "", country, "country"))
+
+    # Sort by relevance - addresses first, then cities, then states, then
+    # countries, then by full string - by sorting the tuples with their rank
+    # prepended, so no key function runs per item
+    ranked = sorted((_LOCATION_TYPE_ORDER[loc[4]],) + loc for loc in locations)
+
+    # Convert to list
+    location_list = [
+        {
+            "full": full_str,
+            "city": city,
+            "state": state,
+            "country": country,
+            "type": loc_type
+        }
+        for _, full_str, city, state, country, loc_type in ranked
+    ]
+
+    texts = [
+        "\n".join((loc["full"], loc["city"], loc["state"], loc["country"])).lower()
+        for loc in location_list
+    ]
+    trigrams: dict[str, list[int]] = {}
+    for position, text in enumerate(texts):
+        for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+            trigrams.setdefault(gram, []).append(position)
+
+    _LOCATIONS_CACHE["version"] = version
+    _LOCATIONS_CACHE["data"] = location_list
+    _LOCATIONS_CACHE["texts"] = texts
+    _LOCATIONS_CACHE["trigrams"] = trigrams
+    return _LOCATIONS_CACHE
 
 
 @router.get("/locations", response_model=List[Dict[str, str]])
@@ -338,93 +546,33 @@ async def get_location_suggestions(
 ):
     """Get location suggestions for typeahead search"""
     try:
-        # Get all properties
-        properties = room_service.get_all()
-
-        # Extract unique locations
-        locations = set()
-
-        for prop in properties:
-            city = prop.get("city", "").strip()
-            state = prop.get("state", "").strip()
-            country = prop.get("country", "").strip()
-
-            # Get address from location object or direct field
-            location_obj = prop.get("location", {})
-            address = ""
-            if isinstance(location_obj, dict):
-                address = location_obj.get("address", "").strip()
-            if not address:
-                address = prop.get("address", "").strip()
-
-            # Add address-level locations (most specific)
-            if address and city and country:
-                # Check if address is different from city (avoid duplication like "Miami, Miami, FL")
-                address_parts = [part.strip() for part in address.split(',')]
-                first_address_part = address_parts[0].lower() if address_parts else ""
-
-                # Only add if the first part of address is different from city
-                if first_address_part != city.lower():
-                    if state:
-                        address_str = f"{address}, {country}"
-                    else:
-                        address_str = f"{address}, {country}"
-                    locations.add((address_str, city, state, country, "address"))
-
-            # Add city-level locations
-            if city and country:
-                if state:
-                    city_str = f"{city}, {state}, {country}"
-                else:
-                    city_str = f"{city}, {country}"
-                locations.add((city_str, city, state, country, "city"))
-
-            # Add state-level location if available
-            if state and country:
-                state_str = f"{state}, {country}"
-                locations.add((state_str, "", state, country, "state"))
-
-            # Add country-level location
-            if country:
-                locations.add((country, "", "", country, "country"))
-
-        # Convert to list and sort
-        location_list = []
-        for loc_tuple in locations:
-            full_str, city, state, country, loc_type = loc_tuple
-            location_list.append({
-                "full": full_str,
-                "city": city,
-                "state": state,
-                "country": country,
-                "type": loc_type
-            })
-
-        # Filter by query if provided
-        if query:
-            query_lower = query.lower()
-            filtered_list = []
-
-            for loc in location_list:
-                # Check if query matches any part of the location
-                full_match = query_lower in loc["full"].lower()
-
-                # Also check individual components for more flexible matching
-                city_match = loc["city"] and query_lower in loc["city"].lower()
-                state_match = loc["state"] and query_lower in loc["state"].lower()
-                country_match = loc["country"] and query_lower in loc["country"].lower()
-
-                if full_match or city_match or state_match or country_match:
-                    filtered_list.append(loc)
-
-            location_list = filtered_list
-
-        # Sort by relevance - addresses first, then cities, then states, then countries
-        type_order = {"address": 1, "city": 2, "state": 3, "country": 4}
-        location_list.sort(key=lambda x: (type_order.get(x["type"], 5), x["full"]))
+        index = _location_index()
+        location_list = index["data"]
 
         # Limit results to avoid too many suggestions
-        return location_list[:10]
+        if not query:
+            return location_list[:10]
+
+        # Filter by query: a match must contain every trigram of the query, so
+        # only the positions listed under its rarest trigram need checking
+        query_lower = query.lower()
+        if len(query_lower) >= 3:
+            trigrams = index["trigrams"]
+            candidates = min(
+                (trigrams.get(query_lower[i:i + 3], ()) for i in range(len(query_lower) - 2)),
+                key=len
+            )
+        else:
+            candidates = range(len(location_list))
+
+        texts = index["texts"]
+        matches = []
+        for position in candidates:
+            if query_lower in texts[position]:
+                matches.append(location_list[position])
+                if len(matches) == 10:
+                    break
+        return matches
 
     except Exception as e:
         raise HTTPException(
@@ -445,10 +593,9 @@ async def get_room(room_id: int):
             detail="Room not found"
         )
 
-    print(f"Found room: {room_obj}")
+    logger.debug("Found room id=%s", room_id)
     # Transform room data
     transformed_room = transform_room_data(room_obj)
-    print(f"Transformed room: {transformed_room}")
 
     # Get house information (same as room for now in 1:1 mapping)
     location = room_obj.get("location", {})
@@ -478,8 +625,9 @@ async def get_room(room_id: int):
 
 # For mock data, simplified creation endpoints
 @router.post("/", response_model=Dict[str, Any])
-async def create_room():
+def create_room():
     """Mock room creation - returns success message only"""
+    invalidate_cache("rooms:*")
     return {
         "message": "Room creation not implemented in mock mode",
         "status": "mock_success"
@@ -489,14 +637,8 @@ async def create_room():
 @router.get("/house/{house_id}/rooms", response_model=List[RoomResponse])
 async def get_rooms_by_house(house_id: int):
     """Get all rooms for a specific house"""
-    properties = room_service.get_all()
-
-    # Find the house
-    house_obj = None
-    for p in properties:
-        if int(p["id"]) == house_id:
-            house_obj = p
-            break
+    # Find the house through the memoized id index
+    house_obj = room_service.get_by_id_fast(house_id)
 
     if not house_obj:
         raise HTTPException(
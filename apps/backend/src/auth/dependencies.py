@@ -1,108 +1,131 @@
 """
 Authentication dependencies for FastAPI routes
 """
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict, Any
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
+from functools import cache
+from typing import Callable, Dict, Any, Optional
 
 from services import auth_service, user_service
 
-security = HTTPBearer()
 
-
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials=Depends(security)
-) -> Dict[str, Any]:
+def _bearer_token(authorization: Optional[str]) -> str:
     """
-    Dependency to get current user from JWT token
+    Extract the token from an "Authorization: Bearer <token>" header
 
-    Args:
-        credentials: HTTP Authorization credentials
-
-    Returns:
-        Current user data
+    Parsed by hand with the same errors HTTPBearer raises.
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If the header is missing or isn't a Bearer credential
     """
-    try:
-        token = credentials.credentials
-        user = auth_service.get_current_user_from_token(token)
-        return user
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not authorization:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authenticated"
         )
+    # The scheme is case-insensitive and must be followed by a space
+    if len(authorization) <= 7 or authorization[:7].lower() != "bearer ":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid authentication credentials"
+        )
+    return authorization[7:]
 
 
-async def get_current_active_user(
-    current_user: Dict[str, Any]=Depends(get_current_user)
-) -> Dict[str, Any]:
+class BearerToken(HTTPBearer):
     """
-    Dependency to get current active user
+    HTTPBearer that returns the raw token, parsed by _bearer_token
 
-    Args:
-        current_user: Current user from token
+    Subclassing keeps the bearer security scheme in the OpenAPI docs (and
+    Swagger's Authorize flow) without building HTTPAuthorizationCredentials
+    on every request.
+    """
 
-    Returns:
-        Current active user data
+    async def __call__(self, request: Request) -> str:
+        return _bearer_token(request.headers.get("authorization"))
 
-    Raises:
-        HTTPException: If user is not active
-    """
-    if not current_user.get('is_active', True):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
-    return current_user
 
+security = BearerToken()
 
-async def get_current_host_user(
-    current_user: Dict[str, Any]=Depends(get_current_active_user)
+
+async def get_current_user(
+    token: str=Depends(security)
 ) -> Dict[str, Any]:
     """
-    Dependency to get current user who is a host
+    Dependency to get current user from JWT token
 
     Args:
-        current_user: Current active user
+        token: Bearer token from the Authorization header
 
     Returns:
-        Current host user data
+        Current user data
 
     Raises:
-        HTTPException: If user is not a host
+        HTTPException: If token is invalid or user not found
     """
-    if not current_user.get('is_host', False):
+    try:
+        user = auth_service.get_current_user_from_token(token)
+        return user
+    except HTTPException:
+        raise
+    except Exception as e:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Host privileges required"
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-    return current_user
 
 
-async def get_current_verified_user(
-    current_user: Dict[str, Any]=Depends(get_current_active_user)
-) -> Dict[str, Any]:
+@cache
+def require_user(
+    *,
+    active: bool=True,
+    host: bool=False,
+    verified: bool=False
+) -> Callable[..., Any]:
     """
-    Dependency to get current verified user
+    Build a dependency that authenticates the user and checks their flags
+
+    Every check runs inside the one dependency instead of a chain of
+    dependencies. Memoized, so each flag combination is the same callable
+    and FastAPI resolves it once per request even when a router and its
+    routes both depend on it.
 
     Args:
-        current_user: Current active user
+        active: Require an active user
+        host: Require host privileges
+        verified: Require a verified account
 
     Returns:
-        Current verified user data
-
-    Raises:
-        HTTPException: If user is not verified
+        Dependency returning the current user data
     """
-    if not current_user.get('is_verified', False):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Account verification required"
-        )
-    return current_user
+    async def dependency(token: str=Depends(security)) -> Dict[str, Any]:
+        current_user = await get_current_user(token)
+        if active and not current_user.get('is_active', True):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Inactive user"
+            )
+        if host and not current_user.get('is_host', False):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Host privileges required"
+            )
+        if verified and not current_user.get('is_verified', False):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Account verification required"
+            )
+        return current_user
+
+    return dependency
+
+
+# Dependency to get current active user
+get_current_active_user = require_user()
+
+# Dependency to get current user who is a host
+get_current_host_user = require_user(host=True)
+
+# Dependency to get current verified user
+get_current_verified_user = require_user(verified=True)
@@ -12,6 +12,7 @@ from typing import Optional, List, Dict, Any
 import os
 import json
 import logging
+from functools import cache
 from pathlib import Path
 
 try:
@@ -22,6 +23,8 @@ except ImportError:
 
 
 # Dynamically load .env or .env.production based on ENVIRONMENT
+# (resolved once; both load_dotenv and Settings.Config use it)
+@cache
 def get_env_file():
     base_dir = Path(__file__).parent.parent.parent
     env_file = base_dir / ".env"
@@ -84,6 +87,7 @@ class Settings(BaseSettings):
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
+    threadpool_size: int = 200  # Worker threads for sync (def) route handlers
 
     # CORS settings
     allowed_origins: List[str] = [
@@ -105,6 +109,12 @@ class Settings(BaseSettings):
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     allowed_image_types: List[str] = ["image/jpeg", "image/png", "image/webp"]
 
+    # Cache (response caching is disabled when unset)
+    redis_url: Optional[str] = None
+
+    # Maps (geolocation falls back to mock data when unset)
+    google_maps_api_key: Optional[str] = None
+
     # Rate limiting
     rate_limit_per_minute: int = 60
     rate_limit_burst: int = 100
@@ -2,14 +2,16 @@
 Middleware module for centralized error handling and response formatting
 """
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
+import secrets
+from contextvars import ContextVar
 import time
 import traceback
 from typing import Callable
 from config.settings import settings
+from utils.responses import DefaultJSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +20,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger("middleware")
 
+# Settings are fixed for the life of the process
+DEBUG = settings.debug
+
+# ID of the request being handled, set by request_handler; readable from
+# any handler or service without going through request.state
+request_id_var: ContextVar[str] = ContextVar("request_id", default="unknown")
+
 class ErrorHandlerMiddleware:
     """
     Middleware for centralized error handling with structured responses
@@ -45,13 +54,13 @@ class ErrorHandlerMiddleware:
             logger.exception(f"Unhandled exception: {exc}")
 
             # Convert to HTTP response
-            response = JSONResponse(
+            response = DefaultJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "detail": "Internal server error",
                     "code": "internal_error",
                     "status": 500,
-                    "request_id": scope.get("request_id", "unknown"),
+                    "request_id": request_id_var.get(),
                 }
             )
 
@@ -63,15 +72,15 @@ async def request_handler(request: Request, call_next: Callable):
     """
     Middleware for request logging, timing, and error handling
     """
-    # Generate a unique request ID
-    request_id = str(time.time())
-    request.state.request_id = request_id
+    # Generate a unique request ID (timestamps collide under concurrency)
+    request_id = secrets.token_hex(8)
+    request_id_var.set(request_id)
 
     # Log the request
     logger.info(f"Request {request_id}: {request.method} {request.url.path}")
 
-    # Time the request
-    start_time = time.time()
+    # Time the request on the monotonic clock, immune to wall clock jumps
+    start_time = time.perf_counter()
 
     try:
         # Process the request
@@ -79,7 +88,7 @@ async def request_handler(request: Request, call_next: Callable):
 
         # Add custom headers
         response.headers["X-Request-ID"] = request_id
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         response.headers["X-Process-Time"] = str(process_time)
 
         # Log the response
@@ -88,9 +97,8 @@ async def request_handler(request: Request, call_next: Callable):
         return response
 
     except Exception as exc:
-        # Log the exception
+        # Log the exception (with its traceback)
         logger.exception(f"Unhandled exception in request {request_id}: {exc}")
-        traceback.print_exc()
 
         # Return error response
         error_content = {
@@ -100,11 +108,11 @@ async def request_handler(request: Request, call_next: Callable):
             "request_id": request_id,
         }
 
-        if settings.debug:
+        if DEBUG:
             error_content["exception"] = str(exc)
             error_content["traceback"] = traceback.format_exc()
 
-        return JSONResponse(
+        return DefaultJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=error_content
         )
@@ -127,14 +135,14 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         })
 
     # Return structured response
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
             "code": "validation_error",
             "status": 422,
             "errors": error_details,
-            "request_id": getattr(request.state, "request_id", "unknown"),
+            "request_id": request_id_var.get(),
         }
     )
 
@@ -147,12 +155,12 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
 
     # Return structured response
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
             "code": f"http_{exc.status_code}",
             "status": exc.status_code,
-            "request_id": getattr(request.state, "request_id", "unknown"),
+            "request_id": request_id_var.get(),
         }
     )
@@ -1,13 +1,14 @@
 """
 Rate limiting middleware for FastAPI
 """
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi import Request, Response, status
+import json
 import time
-import asyncio
-from typing import Dict, Tuple, Optional, Callable
+from collections import OrderedDict
+from typing import Callable, Tuple
 import logging
 from config.settings import settings
+from middleware.error_handler import request_id_var
 
 logger = logging.getLogger("middleware")
 
@@ -16,18 +17,20 @@ logger = logging.getLogger("middleware")
 class InMemoryRateLimiter:
     """Simple in-memory rate limiter using token bucket algorithm"""
 
-    def __init__(self, rate_limit: int = 60, burst_limit: int = 100):
+    def __init__(self, rate_limit: int = 60, burst_limit: int = 100, max_keys: int = 100000):
         """
         Initialize rate limiter
 
         Args:
             rate_limit: Number of requests allowed per minute
             burst_limit: Maximum burst size
+            max_keys: Maximum number of tracked keys (least recently seen are evicted)
         """
         self.rate_limit = rate_limit
         self.burst_limit = burst_limit
-        self.tokens: Dict[str, Tuple[float, float]] = {}  # {key: (tokens, last_refill)}
-        self.lock = asyncio.Lock()
+        self.max_keys = max_keys
+        # {key: (tokens, last_refill)}, least recently refilled first
+        self.tokens: OrderedDict[str, tuple[float, float]] = OrderedDict()
 
         # Use settings if available
         if hasattr(settings, 'rate_limit_per_minute'):
@@ -45,42 +48,56 @@ class InMemoryRateLimiter:
         Returns:
             Tuple of (tokens_left, is_allowed)
         """
-        async with self.lock:
-            now = time.time()
-            tokens, last_refill = self.tokens.get(key, (self.burst_limit, now))
+        # No lock needed: nothing below awaits, so the bucket update can't
+        # interleave with another request on the event loop
+        # Monotonic, so a wall clock jump can't drain or refill buckets
+        now = time.monotonic()
+        tokens, last_refill = self.tokens.get(key, (self.burst_limit, now))
 
-            # Calculate token refill
-            time_passed = now - last_refill
-            refill_amount = time_passed * (self.rate_limit / 60.0)
-            tokens = min(self.burst_limit, tokens + refill_amount)
+        # Calculate token refill
+        time_passed = now - last_refill
+        refill_amount = time_passed * (self.rate_limit / 60.0)
+        tokens = min(self.burst_limit, tokens + refill_amount)
 
-            # Check if request is allowed
-            is_allowed = tokens >= 1.0
+        # Check if request is allowed
+        is_allowed = tokens >= 1.0
 
-            # Consume token if allowed
-            if is_allowed:
-                tokens -= 1.0
+        # Consume token if allowed
+        if is_allowed:
+            tokens -= 1.0
 
-            # Update state
-            self.tokens[key] = (tokens, now)
+        # Update state, keeping the dict ordered by last refill
+        self.tokens[key] = (tokens, now)
+        self.tokens.move_to_end(key)
 
-            # Cleanup expired entries (every 100 requests)
-            if len(self.tokens) > 100 and now % 100 < 1:
-                self._cleanup(now)
+        self._cleanup(now)
 
-            return (tokens, is_allowed)
+        return (tokens, is_allowed)
 
     def _cleanup(self, now: float) -> None:
-        """Remove expired entries (not accessed in the last hour)"""
+        """
+        Remove expired entries (not accessed in the last hour) and cap the size
+
+        Only the oldest entries are looked at, so this costs O(evicted).
+        """
+        tokens = self.tokens
         expiry_time = now - 3600  # 1 hour
-        for key, (_, last_refill) in list(self.tokens.items()):
-            if last_refill < expiry_time:
-                del self.tokens[key]
+        while tokens and (
+            len(tokens) > self.max_keys or next(iter(tokens.values()))[1] < expiry_time
+        ):
+            tokens.popitem(last=False)
 
 
 # Initialize rate limiter
 rate_limiter = InMemoryRateLimiter()
 
+# Serialized 429 body up to the request id, which is the only dynamic field
+_RATE_LIMIT_BODY_PREFIX = json.dumps({
+    "detail": "Rate limit exceeded",
+    "code": "rate_limit_exceeded",
+    "status": 429,
+})[:-1].encode() + b', "request_id": '
+
 
 async def rate_limit_middleware(request: Request, call_next: Callable):
     """
@@ -93,59 +110,52 @@ async def rate_limit_middleware(request: Request, call_next: Callable):
     Returns:
         Response with rate limit headers
     """
-    # Get client identifier (IP address or user ID if authenticated)
-    client_ip = request.client.host if request.client else "unknown"
-
-    # Get user ID if authenticated - safely check without raising error
-    user_id = None
-    try:
-        if hasattr(request, "state") and hasattr(request.state, "user") and request.state.user:
-            user_id = getattr(request.state.user, "id", None)
-    except Exception:
-        # If any error occurs, just use IP-based rate limiting
-        pass
+    # Get client identifier (IP address or user ID if authenticated), read
+    # straight from the ASGI scope rather than through request.client/state
+    scope = request.scope
+    client = scope.get("client")
+    state = scope.get("state") or {}
+    user = state.get("user")
+    user_id = getattr(user, "id", None) if user else None
 
     # Use user_id if available, otherwise use IP
-    rate_limit_key = f"user:{user_id}" if user_id else f"ip:{client_ip}"
+    rate_limit_key = f"user:{user_id}" if user_id else f"ip:{client[0] if client else 'unknown'}"
 
     # Check rate limit
     tokens_left, is_allowed = await rate_limiter.get_tokens(rate_limit_key)
 
-    # Add rate limit headers to all responses
-    response = None
+    burst_limit = rate_limiter.burst_limit
+    rate_limit = rate_limiter.rate_limit
 
+    # Add rate limit headers to all responses
     if is_allowed:
         # Process the request normally
         response = await call_next(request)
 
         # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(rate_limiter.burst_limit)
+        response.headers["X-RateLimit-Limit"] = str(burst_limit)
         response.headers["X-RateLimit-Remaining"] = str(int(tokens_left))
-        response.headers["X-RateLimit-Reset"] = str(int(time.time() + (60 * (1 - tokens_left) / rate_limiter.rate_limit)))
+        response.headers["X-RateLimit-Reset"] = str(int(time.time() + (60 * (1 - tokens_left) / rate_limit)))
 
         return response
     else:
         # Return rate limit exceeded response
         logger.warning(f"Rate limit exceeded for {rate_limit_key}")
 
-        # Calculate reset time
-        reset_time = int(time.time() + (60 * (1 - tokens_left) / rate_limiter.rate_limit))
+        # Calculate reset time (wall clock, for the client)
+        wait = 60 * (1 - tokens_left) / rate_limit
+        reset_time = int(time.time() + wait)
 
-        # Create response with rate limit headers
-        response = JSONResponse(
+        # Create response with rate limit headers from the prebuilt body
+        request_id = json.dumps(request_id_var.get()).encode()
+        return Response(
+            content=_RATE_LIMIT_BODY_PREFIX + request_id + b"}",
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={
-                "detail": "Rate limit exceeded",
-                "code": "rate_limit_exceeded",
-                "status": 429,
-                "request_id": getattr(request.state, "request_id", "unknown"),
+            media_type="application/json",
+            headers={
+                "X-RateLimit-Limit": str(burst_limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset_time),
+                "Retry-After": str(max(1, int(wait))),
             }
         )
-
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(rate_limiter.burst_limit)
-        response.headers["X-RateLimit-Remaining"] = "0"
-        response.headers["X-RateLimit-Reset"] = str(reset_time)
-        response.headers["Retry-After"] = str(max(1, int(reset_time - time.time())))
-
-        return response
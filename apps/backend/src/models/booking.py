@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float, ForeignKey, Enum
+from sqlalchemy import (
+    Column, Integer, String, Boolean, DateTime, Text, Float, ForeignKey, Enum, Index
+)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database.base import Base
@@ -21,6 +23,12 @@ class PaymentStatus(str, enum.Enum):
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # "My bookings", availability checks and status filters
+        Index("ix_bookings_guest", "guest_id"),
+        Index("ix_bookings_property_dates", "property_id", "check_in_date", "check_out_date"),
+        Index("ix_bookings_status", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     guest_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -39,9 +47,16 @@ class Booking(Base):
     service_fee = Column(Float, default=0.0)
     total_price = Column(Float, nullable=False)
     
-    # Status
-    status = Column(Enum(BookingStatus), default=BookingStatus.PENDING)
-    payment_status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING)
+    # Status (stored as VARCHAR and validated in Python, so adding a status
+    # needs no database enum type migration)
+    status = Column(
+        Enum(BookingStatus, native_enum=False, length=16, validate_strings=True),
+        default=BookingStatus.PENDING
+    )
+    payment_status = Column(
+        Enum(PaymentStatus, native_enum=False, length=16, validate_strings=True),
+        default=PaymentStatus.PENDING
+    )
     
     # Payment
     payment_intent_id = Column(String)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database.base import Base
@@ -6,6 +6,10 @@ from ..database.base import Base
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Public reviews of a property
+        Index("ix_reviews_property_public", "property_id", "is_public"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     guest_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -5,6 +5,9 @@ from pydantic import BaseModel, EmailStr, Field, validator
 from typing import Optional, Dict, Any
 import re
 
+_has_letter = re.compile(r'[A-Za-z]').search
+_has_digit = re.compile(r'\d').search
+
 
 class UserRegisterSchema(BaseModel):
     """Schema for user registration"""
@@ -18,17 +21,18 @@ class UserRegisterSchema(BaseModel):
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Za-z]', v):
+        if not _has_letter(v):
             raise ValueError('Password must contain at least one letter')
-        if not re.search(r'\d', v):
+        if not _has_digit(v):
             raise ValueError('Password must contain at least one digit')
         return v
 
     @validator('first_name', 'last_name')
     def validate_names(cls, v):
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Name cannot be empty')
-        return v.strip().title()
+        return v.title()
 
     class Config:
         schema_extra = {
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime, date
 
@@ -18,6 +18,8 @@ class RoomData(BaseModel):
 
 
 class FrontendBookingCreate(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     roomId: str
     userId: int
     startDate: str
@@ -0,0 +1,16 @@
+from datetime import date
+
+from pydantic import BaseModel, model_validator
+
+# ============== CALENDAR SCHEMAS ==============
+
+class DateRangeQuery(BaseModel):
+    """Date range query parameters shared by the calendar endpoints"""
+    start_date: date
+    end_date: date
+
+    @model_validator(mode="after")
+    def check_order(self):
+        if self.end_date <= self.start_date:
+            raise ValueError("end_date must be after start_date")
+        return self
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import json
@@ -129,6 +129,16 @@ class HouseSearch(BaseModel):
     limit: int = 20
 
 
+class HouseQuery(BaseModel):
+    """Query parameters for the house list endpoint"""
+    page: int = Field(1, ge=1, description="Page number (starts from 1)")
+    limit: int = Field(20, ge=0, le=100, description="Number of houses per page (0 = return all)")
+    location: Optional[str] = None
+    property_type: Optional[str] = None
+    amenities: Optional[list[str]] = None
+    instant_bookable: Optional[bool] = None
+
+
 class RoomSearch(BaseModel):
     location: Optional[str] = None
     check_in: Optional[datetime] = None
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, ConfigDict, PositiveFloat
+
+
+class PaymentCreate(BaseModel):
+    """Body of POST /payments"""
+    model_config = ConfigDict(extra="forbid")
+
+    booking_id: int
+    amount: PositiveFloat
+    payment_method: str = "credit_card"
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, RootModel, validator
+from pydantic import BaseModel, ConfigDict, RootModel, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -26,6 +26,10 @@ class ReviewCreate(ReviewBase):
 
 
 class ReviewUpdate(BaseModel):
+    # The frontend PUTs a Partial<ReviewData>, which carries read-only fields
+    # like id and property_id; drop those rather than rejecting the request
+    model_config = ConfigDict(extra="ignore")
+
     overall_rating: Optional[float] = None
     cleanliness_rating: Optional[float] = None
     accuracy_rating: Optional[float] = None
@@ -34,6 +38,7 @@ class ReviewUpdate(BaseModel):
     check_in_rating: Optional[float] = None
     value_rating: Optional[float] = None
     comment: Optional[str] = None
+    private_comment: Optional[str] = None
     is_public: Optional[bool] = None
     host_response: Optional[str] = None
 
@@ -2,8 +2,10 @@
 Authentication service for handling user authentication and authorization
 """
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import logging
+import time
 
 try:
     from passlib.context import CryptContext
@@ -37,6 +39,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of verified tokens remembered by AuthService.verify_token
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+
 class AuthService:
     """Service for authentication operations"""
 
@@ -55,6 +60,10 @@ class AuthService:
         self.algorithm = getattr(settings, 'algorithm', 'HS256')
         self.access_token_expire_minutes = getattr(settings, 'access_token_expire_minutes', 30)
 
+        # Decoded payloads of valid tokens, so a client's repeat requests
+        # skip the signature check; failures raise and are never cached
+        self._decode_token_cached = lru_cache(maxsize=VERIFIED_TOKEN_CACHE_SIZE)(self._decode_token)
+
     def hash_password(self, password: str) -> str:
         """Hash a password"""
         if PASSLIB_AVAILABLE and self.pwd_context:
@@ -104,6 +113,9 @@ class AuthService:
         """
         Verify and decode a JWT token
 
+        Valid tokens are remembered until they expire, so the returned
+        payload is shared between requests and must be treated as read-only.
+
         Args:
             token: JWT token to verify
 
@@ -113,6 +125,24 @@ class AuthService:
         Raises:
             HTTPException: If token is invalid
         """
+        # A JWT is always header.payload.signature; reject anything else
+        # without calling the decoder
+        if JOSE_AVAILABLE and token.count(".") != 2:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        payload = self._decode_token_cached(token)
+        exp = payload.get("exp")
+        if exp is not None and time.time() >= exp:
+            # Expired since it was cached: decode again to raise the usual error
+            payload = self._decode_token(token)
+        return payload
+
+    def _decode_token(self, token: str) -> dict[str, Any]:
+        """Uncached part of verify_token"""
         try:
             if JOSE_AVAILABLE:
                 payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from utils.data_manager import DataManager
+from utils.request_cache import request_memoized
 
 logger = logging.getLogger(__name__)
 
@@ -73,10 +74,14 @@ class BaseService(ABC):
             raise ValidationError("Data cannot be empty")
         return data
 
+    @request_memoized
     def get_all(self, skip: int=0, limit: int=100, filters: Optional[Dict[str, Any]]=None) -> List[Dict[str, Any]]:
         """
         Get all items with optional filtering and pagination
 
+        Memoized per request (see utils.request_cache), so don't mutate the
+        returned list.
+
         Args:
             skip: Number of items to skip
             limit: Maximum number of items to return
@@ -120,6 +125,66 @@ class BaseService(ABC):
             self.logger.error(f"Error getting {self.domain_name} by ID {item_id}: {e}")
             raise ServiceError(f"Failed to retrieve {self.domain_name}")
 
+    def get_by_id_fast(self, item_id: Any) -> Optional[dict[str, Any]]:
+        """
+        Get item by ID through the data manager's memoized id index
+
+        Unlike get_by_id this returns None instead of raising, and the
+        returned item is shared with other callers, so treat it as read-only.
+
+        Args:
+            item_id: ID of the item
+
+        Returns:
+            Item data, or None if not found
+        """
+        try:
+            return self.data_manager.get_index(self.get_primary_file()).get(str(item_id))
+        except Exception as e:
+            self.logger.error(f"Error getting {self.domain_name} by ID {item_id}: {e}")
+            raise ServiceError(f"Failed to retrieve {self.domain_name}") from e
+
+    def exists(self, item_id: Any) -> bool:
+        """
+        Check whether an item exists using the memoized id index
+
+        Args:
+            item_id: ID of the item
+
+        Returns:
+            True if an item with this ID exists
+        """
+        try:
+            return str(item_id) in self.data_manager.get_index(self.get_primary_file())
+        except Exception as e:
+            self.logger.error(f"Error checking {self.domain_name} {item_id} exists: {e}")
+            raise ServiceError(f"Failed to retrieve {self.domain_name}") from e
+
+    def get_many(self, item_ids: list[Any]) -> dict[Any, dict[str, Any]]:
+        """
+        Get several items by ID with a single index lookup
+
+        Returned items are shared with other callers, so treat them as read-only.
+
+        Args:
+            item_ids: IDs of the items
+
+        Returns:
+            Dict mapping each requested ID that exists to its item
+        """
+        try:
+            index = self.data_manager.get_index(self.get_primary_file())
+        except Exception as e:
+            self.logger.error(f"Error getting {self.domain_name} items by ID: {e}")
+            raise ServiceError(f"Failed to retrieve {self.domain_name}") from e
+
+        found = {}
+        for item_id in item_ids:
+            item = index.get(str(item_id))
+            if item is not None:
+                found[item_id] = item
+        return found
+
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create new item
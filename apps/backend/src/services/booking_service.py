@@ -3,11 +3,25 @@ Booking service for handling booking-related operations
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date, timedelta
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 
 from .base_service import BaseService, ValidationError, NotFoundError, ConflictError
 from utils.data_manager import bookings_manager, properties_manager, users_manager
 
 
+# Booking statuses that hold the property's dates
+BLOCKING_STATUSES = frozenset({"confirmed", "pending"})
+
+# (sorted (check_in, check_out) ordinals, check-in ordinals, running max check-outs)
+IntervalIndex = tuple[list[tuple[int, int]], list[int], list[int]]
+
+
+def date_ordinal(value: str) -> int:
+    """Parse an ISO date/datetime string (with or without trailing 'Z') to a day ordinal"""
+    return date.fromisoformat(value[:10]).toordinal()
+
+
 class BookingService(BaseService):
     """Service for booking operations including creation, management, and validation"""
 
@@ -15,6 +29,8 @@ class BookingService(BaseService):
         super().__init__(bookings_manager, "booking")
         self.properties_manager = properties_manager
         self.users_manager = users_manager
+        # (file version, {property_id: IntervalIndex})
+        self._intervals_cache: Optional[tuple[Any, dict[str, IntervalIndex]]] = None
 
     def get_primary_file(self) -> str:
         return "bookings.json"
@@ -102,49 +118,154 @@ class BookingService(BaseService):
             True if available, False otherwise
         """
         try:
-            existing_bookings = self.find_by_field("property_id", property_id)
-
-            for booking in existing_bookings:
-                if booking.get("status") in ["confirmed", "pending"]:
-                    booking_check_in = datetime.fromisoformat(booking["check_in"].replace('Z', '+00:00')).date()
-                    booking_check_out = datetime.fromisoformat(booking["check_out"].replace('Z', '+00:00')).date()
-
-                    # Check for date overlap
-                    if not (check_out <= booking_check_in or check_in >= booking_check_out):
-                        return False
-
-            return True
+            return self.is_range_available(property_id, check_in.toordinal(), check_out.toordinal())
         except Exception as e:
             self.logger.error(f"Error checking availability: {e}")
             return False
 
-    def get_user_bookings(self, user_id: int, status: Optional[str]=None) -> List[Dict[str, Any]]:
+    def get_by_id_for_user(self, booking_id: int, user_id: int) -> dict[str, Any]:
+        """
+        Get a booking by ID only if it belongs to the given guest
+
+        Bookings of other guests are reported as not found, so callers
+        can't probe which booking IDs exist.
+
+        Args:
+            booking_id: Booking ID
+            user_id: ID of the guest who must own the booking
+
+        Returns:
+            Booking data (shared; treat as read-only)
+
+        Raises:
+            NotFoundError: If the booking doesn't exist or belongs to someone else
+        """
+        booking = self.get_by_id_fast(booking_id)
+        if not booking or str(booking.get("guest_id")) != str(user_id):
+            raise NotFoundError(f"Booking with ID {booking_id} not found")
+        return booking
+
+    def _interval_index(self, property_id: int) -> IntervalIndex:
+        """
+        Get a property's booked intervals sorted by check-in, with bisect helpers
+
+        Dates are parsed once per bookings file version rather than per
+        request. Bookings reference the property through either property_id
+        or room_id and store dates under check_in/check_out or the *_date
+        variants; only confirmed and pending bookings (BLOCKING_STATUSES)
+        hold dates.
+
+        Returns:
+            Tuple of (sorted (check_in, check_out) ordinals, check-in ordinals,
+            running maximum of check-out ordinals)
+        """
+        file_name = self.get_primary_file()
+        version = self.data_manager.version(file_name)
+        if self._intervals_cache is None or self._intervals_cache[0] != version:
+            grouped: dict[str, list[tuple[int, int]]] = {}
+            for booking in self.data_manager.load(file_name):
+                if booking.get("status") not in BLOCKING_STATUSES:
+                    continue
+                check_in = booking.get("check_in_date") or booking.get("check_in")
+                check_out = booking.get("check_out_date") or booking.get("check_out")
+                if not check_in or not check_out:
+                    continue
+                try:
+                    interval = (date_ordinal(check_in), date_ordinal(check_out))
+                except ValueError:
+                    continue
+                key = str(booking.get("property_id", booking.get("room_id")))
+                grouped.setdefault(key, []).append(interval)
+
+            index = {}
+            for key, intervals in grouped.items():
+                intervals.sort()
+                starts = [check_in for check_in, _ in intervals]
+                max_ends = list(accumulate((check_out for _, check_out in intervals), max))
+                index[key] = (intervals, starts, max_ends)
+            self._intervals_cache = (version, index)
+
+        return self._intervals_cache[1].get(str(property_id), ([], [], []))
+
+    def _overlap_bounds(self, property_id: int, start: int,
+                        end: int) -> tuple[list[tuple[int, int]], int, int]:
+        """Slice bounds of the intervals that may overlap [start, end), found by bisection"""
+        intervals, starts, max_ends = self._interval_index(property_id)
+        # Everything before lo checks out on or before `start`;
+        # from hi on checks in at or after `end`
+        lo = bisect_right(max_ends, start)
+        hi = bisect_left(starts, end)
+        return intervals, lo, hi
+
+    def get_booked_intervals(self, property_id: int, start: int, end: int) -> list[tuple[int, int]]:
         """
-        Get bookings for a specific user
+        Get the booked intervals of a property that overlap a date range
+
+        Args:
+            property_id: Property ID
+            start: First day of the range (date ordinal)
+            end: Day after the range (date ordinal, exclusive)
+
+        Returns:
+            List of (check_in, check_out) date ordinals overlapping [start, end)
+        """
+        intervals, lo, hi = self._overlap_bounds(property_id, start, end)
+        return [(ci, co) for ci, co in intervals[lo:hi] if co > start]
+
+    def is_range_available(self, property_id: int, start: int, end: int) -> bool:
+        """
+        Check whether no confirmed or pending booking overlaps [start, end), in O(log N + k)
+
+        Args:
+            property_id: Property ID
+            start: Check-in date ordinal
+            end: Check-out date ordinal (exclusive)
+
+        Returns:
+            True if the range is free
+        """
+        intervals, lo, hi = self._overlap_bounds(property_id, start, end)
+        return not any(co > start for _, co in intervals[lo:hi])
+
+    def get_user_bookings(self, user_id: int, status: Optional[str]=None, skip: int=0,
+                          limit: Optional[int]=None) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get a page of bookings for a specific user
 
         Args:
             user_id: User ID
             status: Optional status filter
+            skip: Number of bookings to skip
+            limit: Maximum number of bookings to return (None = all)
 
         Returns:
-            List of user bookings with property details
+            Tuple of (page of user bookings with property details, total matching bookings)
         """
         try:
-            user_bookings = self.find_by_field("guest_id", user_id)
+            by_guest = self.data_manager.get_group_index(self.get_primary_file(), "guest_id")
+            user_bookings = by_guest.get(str(user_id), [])
 
             if status:
                 user_bookings = [b for b in user_bookings if b.get("status") == status]
 
-            # Enrich with property details
-            rooms = self.properties_manager.load("rooms.json")
-            property_dict = {p["id"]: p for p in rooms}
+            # Paginate before enriching so only the returned page is joined
+            end_idx = None if limit is None else skip + limit
+            page = user_bookings[skip:end_idx]
+
+            # Batch-resolve the page's properties through the id index
+            rooms_by_id = self.properties_manager.get_index("rooms.json")
+            property_dict = {
+                room_id: rooms_by_id.get(room_id)
+                for room_id in {str(b["room_id"]) for b in page}
+            }
 
             enriched_bookings = []
-            for booking in user_bookings:
+            for booking in page:
+                room_id = str(booking["room_id"])
                 # Transform booking data to match frontend expectations
                 transformed_booking = {
                     "id": booking["id"],
-                    "roomId": str(booking["room_id"]),
+                    "roomId": room_id,
                     "userId": booking["guest_id"],
                     "startDate": booking.get("check_in_date") or booking.get("check_in"),
                     "endDate": booking.get("check_out_date") or booking.get("check_out"),
@@ -160,7 +281,7 @@ class BookingService(BaseService):
                 }
 
                 # Add property details
-                property_data = property_dict.get(booking["room_id"])
+                property_data = property_dict.get(room_id)
                 if property_data:
                     transformed_booking["roomData"] = {
                         "title": property_data.get("property_name", ""),
@@ -171,36 +292,70 @@ class BookingService(BaseService):
 
                 enriched_bookings.append(transformed_booking)
 
-            return enriched_bookings
+            return enriched_bookings, len(user_bookings)
         except Exception as e:
             self.logger.error(f"Error getting user bookings: {e}")
             raise
 
-    def get_property_bookings(self, property_id: int, status: Optional[str]=None) -> List[Dict[str, Any]]:
+    def get_property_bookings(self, property_id: int, host_id: Optional[int],
+                              status: Optional[str]=None, skip: int=0, limit: Optional[int]=None,
+                              after_id: Optional[int]=None) -> tuple[list[dict[str, Any]], int]:
         """
-        Get bookings for a specific property
+        Get a page of bookings for a specific property
+
+        Only the property's host may list its bookings, since they include
+        guest contact details. Properties of other hosts are reported as not
+        found, so callers can't probe which property IDs exist.
 
         Args:
             property_id: Property ID
+            host_id: ID of the host who must own the property (None skips the check, for admins)
             status: Optional status filter
+            skip: Number of bookings to skip (ignored when after_id is given)
+            limit: Maximum number of bookings to return (None = all)
+            after_id: Keyset cursor; return bookings with an ID greater than this
 
         Returns:
-            List of property bookings with guest details
+            Tuple of (page of property bookings in ID order with guest details,
+            total matching bookings)
+
+        Raises:
+            NotFoundError: If the property doesn't exist or belongs to another host
         """
-        try:
-            property_bookings = self.find_by_field("property_id", property_id)
+        if host_id is not None:
+            property_data = self.properties_manager.get_index("rooms.json").get(str(property_id))
+            if not property_data or str(property_data.get("host_id")) != str(host_id):
+                raise NotFoundError(f"Property with ID {property_id} not found")
 
-            if status:
-                property_bookings = [b for b in property_bookings if b.get("status") == status]
+        try:
+            # Bookings reference the property as either property_id or room_id
+            key = str(property_id)
+            property_bookings = [
+                b for b in self.data_manager.load(self.get_primary_file())
+                if str(b.get("property_id", b.get("room_id"))) == key
+                and (not status or b.get("status") == status)
+            ]
+
+            # Pages are in ID order so after_id cursors are stable, whatever the
+            # order in the file (usually already sorted, which sort handles in one pass)
+            property_bookings.sort(key=lambda b: int(b["id"]))
+            if after_id is not None:
+                skip = next(
+                    (i for i, b in enumerate(property_bookings) if int(b["id"]) > after_id),
+                    len(property_bookings)
+                )
+
+            # Paginate before enriching so only the returned page is joined
+            end_idx = None if limit is None else skip + limit
+            page = property_bookings[skip:end_idx]
 
             # Enrich with guest details
-            users = self.users_manager.load("users.json")
-            user_dict = {u["id"]: u for u in users}
+            user_dict = self.users_manager.get_index("users.json")
 
             enriched_bookings = []
-            for booking in property_bookings:
+            for booking in page:
                 enriched_booking = booking.copy()
-                guest_data = user_dict.get(booking["guest_id"])
+                guest_data = user_dict.get(str(booking["guest_id"]))
                 if guest_data:
                     enriched_booking["guest"] = {
                         "id": guest_data["id"],
@@ -211,7 +366,7 @@ class BookingService(BaseService):
                     }
                 enriched_bookings.append(enriched_booking)
 
-            return enriched_bookings
+            return enriched_bookings, len(property_bookings)
         except Exception as e:
             self.logger.error(f"Error getting property bookings: {e}")
             raise
@@ -4,8 +4,8 @@ Geolocation services for maps and nearby attractions
 from typing import Dict, Any, List, Optional, Tuple
 import logging
 import requests
-from ..config.settings import settings
-from ..utils.cache import cache
+from config.settings import settings
+from utils.cache import cache
 
 logger = logging.getLogger("geolocation")
 
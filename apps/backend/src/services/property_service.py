@@ -2,6 +2,7 @@
 Property service for handling property-related operations
 """
 from typing import List, Dict, Any, Optional
+from collections.abc import Iterator
 from datetime import datetime, date, timedelta
 import json
 
@@ -61,7 +62,7 @@ class PropertyService(BaseService):
                          check_in: Optional[str]=None,
                          check_out: Optional[str]=None,
                          skip: int=0,
-                         limit: int=20) -> List[Dict[str, Any]]:
+                         limit: Optional[int]=20) -> tuple[list[dict[str, Any]], int]:
         """
         Search properties with multiple filters
 
@@ -75,52 +76,21 @@ class PropertyService(BaseService):
             check_in: Check-in date for availability
             check_out: Check-out date for availability
             skip: Pagination skip
-            limit: Pagination limit
+            limit: Pagination limit (None = all)
 
         Returns:
-            List of filtered properties with enriched data
+            Tuple of (page of filtered properties with enriched data, total matching properties)
         """
         try:
-            properties = self.data_manager.load(self.get_primary_file())
-
-            # Apply filters
-            filtered_properties = properties
-
-            if city:
-                filtered_properties = [p for p in filtered_properties
-                                     if p.get("city", "").lower() == city.lower()]
-
-            if country:
-                filtered_properties = [p for p in filtered_properties
-                                     if p.get("country", "").lower() == country.lower()]
-
-            if property_type:
-                filtered_properties = [p for p in filtered_properties
-                                     if p.get("property_type", "").lower() == property_type.lower()]
-
-            if min_price is not None:
-                filtered_properties = [p for p in filtered_properties
-                                     if p.get("price_per_night", 0) >= min_price]
+            filtered_properties = self._filter_properties(
+                city=city, country=country, property_type=property_type,
+                min_price=min_price, max_price=max_price, min_guests=min_guests,
+                check_in=check_in, check_out=check_out
+            )
 
-            if max_price is not None:
-                filtered_properties = [p for p in filtered_properties
-                                     if p.get("price_per_night", 0) <= max_price]
-
-            if min_guests is not None:
-                filtered_properties = [p for p in filtered_properties
-                                     if p.get("max_guests", 1) >= min_guests]
-
-            # Check availability if dates provided
-            if check_in and check_out:
-                available_properties = []
-                for prop in filtered_properties:
-                    if self._check_property_availability(prop["id"], check_in, check_out):
-                        available_properties.append(prop)
-                filtered_properties = available_properties
-
-            # Apply pagination
+            # Apply pagination before enriching so only the page is materialized
             total = len(filtered_properties)
-            end_idx = min(skip + limit, total)
+            end_idx = total if limit is None else min(skip + limit, total)
             paginated_properties = filtered_properties[skip:end_idx]
 
             # Enrich with additional data
@@ -129,12 +99,93 @@ class PropertyService(BaseService):
                 enriched_prop = self._enrich_property_data(prop)
                 enriched_properties.append(enriched_prop)
 
-            return enriched_properties
+            return enriched_properties, total
 
         except Exception as e:
             self.logger.error(f"Error searching properties: {e}")
             raise
 
+    def iter_search_properties(self,
+                               city: Optional[str]=None,
+                               country: Optional[str]=None,
+                               property_type: Optional[str]=None,
+                               min_price: Optional[float]=None,
+                               max_price: Optional[float]=None,
+                               min_guests: Optional[int]=None,
+                               check_in: Optional[str]=None,
+                               check_out: Optional[str]=None) -> tuple[Iterator[dict], int]:
+        """
+        Search properties with multiple filters, enriching matches lazily
+
+        Takes the same filters as search_properties but without pagination,
+        so large result sets can be streamed instead of built up front.
+
+        Returns:
+            Tuple of (iterator over filtered properties with enriched data,
+            total matching properties)
+        """
+        try:
+            filtered_properties = self._filter_properties(
+                city=city, country=country, property_type=property_type,
+                min_price=min_price, max_price=max_price, min_guests=min_guests,
+                check_in=check_in, check_out=check_out
+            )
+        except Exception as e:
+            self.logger.error(f"Error searching properties: {e}")
+            raise
+
+        enriched = (self._enrich_property_data(prop) for prop in filtered_properties)
+        return enriched, len(filtered_properties)
+
+    def _filter_properties(self,
+                           city: Optional[str]=None,
+                           country: Optional[str]=None,
+                           property_type: Optional[str]=None,
+                           min_price: Optional[float]=None,
+                           max_price: Optional[float]=None,
+                           min_guests: Optional[int]=None,
+                           check_in: Optional[str]=None,
+                           check_out: Optional[str]=None) -> list[dict[str, Any]]:
+        """Apply the search filters to the primary property file"""
+        properties = self.data_manager.load(self.get_primary_file())
+
+        # Apply filters
+        filtered_properties = properties
+
+        if city:
+            filtered_properties = [p for p in filtered_properties
+                                 if p.get("city", "").lower() == city.lower()]
+
+        if country:
+            filtered_properties = [p for p in filtered_properties
+                                 if p.get("country", "").lower() == country.lower()]
+
+        if property_type:
+            filtered_properties = [p for p in filtered_properties
+                                 if p.get("property_type", "").lower() == property_type.lower()]
+
+        if min_price is not None:
+            filtered_properties = [p for p in filtered_properties
+                                 if p.get("price_per_night", 0) >= min_price]
+
+        if max_price is not None:
+            filtered_properties = [p for p in filtered_properties
+                                 if p.get("price_per_night", 0) <= max_price]
+
+        if min_guests is not None:
+            filtered_properties = [p for p in filtered_properties
+                                 if p.get("max_guests", 1) >= min_guests]
+
+        # Check availability if dates provided
+        if check_in and check_out:
+            available_properties = []
+            for prop in filtered_properties:
+                if self._check_property_availability(prop["id"], check_in, check_out):
+                    available_properties.append(prop)
+            filtered_properties = available_properties
+
+        return filtered_properties
+
     def get_property_details(self, property_id: int) -> Dict[str, Any]:
         """
         Get detailed property information with reviews and availability
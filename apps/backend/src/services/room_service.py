@@ -3,11 +3,15 @@ Property service for handling property-related operations
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date, timedelta
+from bisect import bisect_left, bisect_right
 import json
 
 from .base_service import BaseService, ValidationError, NotFoundError
 from utils.data_manager import properties_manager, reviews_manager, bookings_manager
 
+# (sorted latitudes, matching (longitude, file position, room) entries)
+CoordinateIndex = tuple[list[float], list[tuple[float, int, dict[str, Any]]]]
+
 
 class RoomService(BaseService):
     """Service for room operations including search, details, and availability"""
@@ -16,6 +20,9 @@ class RoomService(BaseService):
         super().__init__(properties_manager, "room")
         self.reviews_manager = reviews_manager
         self.bookings_manager = bookings_manager
+        # Rooms with coordinates sorted by latitude, valid for _coordinate_index_version
+        self._coordinate_index: Optional[CoordinateIndex] = None
+        self._coordinate_index_version = None
 
     def get_high_priority_file(self) -> str:
         return "nyc-properties.json"
@@ -501,61 +508,84 @@ class RoomService(BaseService):
 
         return filtered_properties
 
-    def _filter_by_bounds(self, properties: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _parse_bounds(self, filters: dict[str, Any]) -> Optional[tuple[float, float, float, float]]:
         """
-        Filter properties by geographic bounds (map viewport)
+        Parse geographic bounds (map viewport) from the search filters
 
         Args:
-            properties: List of properties to filter
             filters: Dictionary containing bounds (ne_lat, ne_lng, sw_lat, sw_lng)
 
         Returns:
-            Filtered list of properties within the bounds
+            (sw_lat, sw_lng, ne_lat, ne_lng), or None if bounds are missing or invalid
         """
         # Check if all required bounds parameters are present
         required_bounds = ["ne_lat", "ne_lng", "sw_lat", "sw_lng"]
         if not all(key in filters and filters[key] is not None for key in required_bounds):
-            return properties
+            return None
 
         try:
-            ne_lat = float(filters["ne_lat"])
-            ne_lng = float(filters["ne_lng"])
-            sw_lat = float(filters["sw_lat"])
-            sw_lng = float(filters["sw_lng"])
-
-            filtered_properties = []
-
-            for prop in properties:
-                # Get coordinates from location object
-                location_obj = prop.get("location", {})
-                latitude = None
-                longitude = None
+            return (
+                float(filters["sw_lat"]),
+                float(filters["sw_lng"]),
+                float(filters["ne_lat"]),
+                float(filters["ne_lng"])
+            )
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f"Error parsing bounds: {e}")
+            return None
 
-                if isinstance(location_obj, dict):
-                    latitude = location_obj.get("lat")
-                    longitude = location_obj.get("lng")
+    def _rooms_by_latitude(self) -> CoordinateIndex:
+        """
+        Rooms with valid coordinates sorted by latitude
 
-                # Skip properties without valid coordinates
-                if latitude is None or longitude is None:
+        Returns the sorted latitudes (for bisect) alongside matching
+        (longitude, file position, room) entries. Rebuilt once per version of
+        the rooms file.
+        """
+        version = self.data_manager.version(self.get_primary_file())
+        if self._coordinate_index is None or version != self._coordinate_index_version:
+            points = []
+            for position, room in enumerate(self.data_manager.load(self.get_primary_file())):
+                location_obj = room.get("location")
+                if not isinstance(location_obj, dict):
                     continue
-
                 try:
-                    lat = float(latitude)
-                    lng = float(longitude)
-
-                    # Check if property is within bounds
-                    if (sw_lat <= lat <= ne_lat and sw_lng <= lng <= ne_lng):
-                        filtered_properties.append(prop)
-
-                except (ValueError, TypeError):
-                    # Skip properties with invalid coordinates
+                    lat = float(location_obj["lat"])
+                    lng = float(location_obj["lng"])
+                except (KeyError, ValueError, TypeError):
                     continue
+                points.append((lat, lng, position, room))
+            points.sort(key=lambda point: point[0])
+            self._coordinate_index = (
+                [point[0] for point in points],
+                [(lng, position, room) for _, lng, position, room in points]
+            )
+            self._coordinate_index_version = version
+        return self._coordinate_index
+
+    def get_rooms_in_bounds(self, sw_lat: float, sw_lng: float,
+                            ne_lat: float, ne_lng: float) -> list[dict[str, Any]]:
+        """
+        Get rooms inside a map viewport
 
-            return filtered_properties
+        Binary-searches the latitude-sorted index for the viewport's latitude
+        band, then checks longitude only for rooms in that band. Rooms are
+        returned in file order and are shared, so treat them as read-only.
 
-        except (ValueError, TypeError) as e:
-            self.logger.warning(f"Error parsing bounds: {e}")
-            return properties
+        Args:
+            sw_lat: South-west corner latitude
+            sw_lng: South-west corner longitude
+            ne_lat: North-east corner latitude
+            ne_lng: North-east corner longitude
+
+        Returns:
+            Rooms whose coordinates fall within the bounds
+        """
+        latitudes, entries = self._rooms_by_latitude()
+        band = entries[bisect_left(latitudes, sw_lat):bisect_right(latitudes, ne_lat)]
+        matches = [(position, room) for lng, position, room in band if sw_lng <= lng <= ne_lng]
+        matches.sort(key=lambda match: match[0])
+        return [room for _, room in matches]
 
     def _filter_by_flexible_search(self, properties: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -741,8 +771,11 @@ class RoomService(BaseService):
         Returns:
             List of filtered properties
         """
-        # Start with all properties
-        properties = self.get_all()
+        # Apply geographic bounds filtering (map-based search) first: the
+        # viewport is answered from the latitude index, so only rooms inside
+        # it reach the other filters
+        bounds = self._parse_bounds(filters)
+        properties = self.get_rooms_in_bounds(*bounds) if bounds else self.get_all()
 
         # Apply location filtering using the reusable function
         properties = self._filter_by_location(properties, filters.get("location"))
@@ -753,9 +786,6 @@ class RoomService(BaseService):
         # Apply date availability filtering
         properties = self._filter_by_availability(properties, filters)
 
-        # Apply geographic bounds filtering (map-based search)
-        properties = self._filter_by_bounds(properties, filters)
-
         # Apply bedrooms filtering
         if filters.get("bedrooms") and filters["bedrooms"] != "Any":
             bedrooms = int(filters["bedrooms"]) if isinstance(filters["bedrooms"], str) else filters["bedrooms"]
@@ -5,9 +5,12 @@ import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from .base_service import BaseService, ValidationError, NotFoundError, ConflictError
+from .base_service import BaseService, ServiceError, ValidationError, NotFoundError, ConflictError
 from utils.data_manager import users_manager
 
+# One user's notifications by read state: {None: all, True: read, False: unread}, each newest first
+NotificationViews = dict[Optional[bool], list[dict[str, Any]]]
+
 class UserService(BaseService):
     def get_wishlists(self, user_id: int = None, include_properties: bool = False, skip: int = 0, limit: int = 10) -> list:
         """
@@ -25,6 +28,12 @@ class UserService(BaseService):
 
     def __init__(self):
         super().__init__(users_manager, "user")
+        # user_id -> unread notification count, valid for _unread_counts_version
+        self._unread_counts: Optional[dict[Any, int]] = None
+        self._unread_counts_version = None
+        # str(user_id) -> NotificationViews
+        self._notification_views: Optional[dict[str, NotificationViews]] = None
+        self._notification_views_version = None
 
     def get_primary_file(self) -> str:
         return "users.json"
@@ -174,24 +183,157 @@ class UserService(BaseService):
         self.logger.info(f"Password changed for user {user_id}")
         return True
 
-    def get_user_notifications(self, user_id: int) -> List[Dict[str, Any]]:
+    def get_user_notifications(self, user_id: int, is_read: Optional[bool]=None, skip: int=0,
+                               limit: Optional[int]=None) -> tuple[list[dict[str, Any]], int]:
         """
-        Get notifications for a user
+        Get a page of notifications for a user, newest first
 
         Args:
             user_id: User ID
+            is_read: Optional read-state filter
+            skip: Number of notifications to skip
+            limit: Maximum number of notifications to return (None = all)
 
         Returns:
-            List of user notifications
+            Tuple of (page of user notifications, total matching notifications)
         """
         try:
-            notifications = self.data_manager.load("notifications.json")
-            user_notifications = [n for n in notifications if n.get("user_id") == user_id]
-            # Sort by created_at descending
-            return sorted(user_notifications, key=lambda x: x.get("created_at", ""), reverse=True)
+            user_notifications = self._user_notification_views(user_id)[is_read]
+            end_idx = None if limit is None else skip + limit
+            return user_notifications[skip:end_idx], len(user_notifications)
         except Exception as e:
             self.logger.error(f"Error getting notifications for user {user_id}: {e}")
-            return []
+            return [], 0
+
+    def _user_notification_views(self, user_id: int) -> NotificationViews:
+        """
+        A user's notifications pre-sorted newest first and partitioned by read state
+
+        Built for all users in one pass per notifications.json version, so a
+        page is a slice instead of a filter and sort.
+        """
+        version = self.data_manager.version("notifications.json")
+        if self._notification_views is None or version != self._notification_views_version:
+            notifications = sorted(self.data_manager.load("notifications.json"),
+                                   key=lambda x: x.get("created_at", ""), reverse=True)
+            views: dict[str, NotificationViews] = {}
+            for notification in notifications:
+                view = views.get(str(notification.get("user_id")))
+                if view is None:
+                    view = views[str(notification.get("user_id"))] = {None: [], True: [], False: []}
+                view[None].append(notification)
+                read_state = notification.get("is_read")
+                if read_state is True or read_state is False:
+                    view[read_state].append(notification)
+            self._notification_views = views
+            self._notification_views_version = version
+        return self._notification_views.get(str(user_id)) or {None: [], True: [], False: []}
+
+    def get_user_notification(self, user_id: int, notification_id: int) -> Optional[dict[str, Any]]:
+        """
+        Get one of a user's notifications through the notifications id index
+
+        Args:
+            user_id: User ID
+            notification_id: Notification ID
+
+        Returns:
+            The notification, or None if it doesn't exist or belongs to another user
+        """
+        try:
+            notifications = self.data_manager.get_index("notifications.json")
+            notification = notifications.get(str(notification_id))
+        except Exception as e:
+            self.logger.error(f"Error getting notification {notification_id}: {e}")
+            return None
+        if notification is None or notification.get("user_id") != user_id:
+            return None
+        return notification
+
+    def _unread_count_table(self) -> dict[Any, int]:
+        """Per-user unread counts, rebuilt only when notifications.json changes elsewhere"""
+        version = self.data_manager.version("notifications.json")
+        if self._unread_counts is None or version != self._unread_counts_version:
+            counts: dict[Any, int] = {}
+            for notification in self.data_manager.load("notifications.json"):
+                if not notification.get("is_read"):
+                    user_id = notification.get("user_id")
+                    counts[user_id] = counts.get(user_id, 0) + 1
+            self._unread_counts = counts
+            self._unread_counts_version = version
+        return self._unread_counts
+
+    def get_unread_count(self, user_id: int) -> int:
+        """
+        Get the number of unread notifications for a user
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Unread notification count
+        """
+        try:
+            return self._unread_count_table().get(user_id, 0)
+        except Exception as e:
+            self.logger.error(f"Error counting unread notifications for user {user_id}: {e}")
+            return 0
+
+    def mark_notification_read(self, user_id: int,
+                               notification_id: int) -> Optional[dict[str, Any]]:
+        """
+        Mark one of a user's notifications as read
+
+        Args:
+            user_id: User ID
+            notification_id: Notification ID
+
+        Returns:
+            The updated notification, or None if the user has no such notification
+        """
+        notification = self.get_user_notification(user_id, notification_id)
+        if notification is None or notification.get("is_read"):
+            return notification
+
+        counts = self._unread_count_table()
+        updated = self.data_manager.update("notifications.json", notification_id, {"is_read": True})
+        if updated is None:
+            # Gone from disk since the index lookup; nothing was written
+            return None
+
+        # Our own write: adjust the counter and adopt the new file version
+        counts[user_id] = max(counts.get(user_id, 0) - 1, 0)
+        self._unread_counts_version = self.data_manager.version("notifications.json")
+        return updated
+
+    def mark_all_notifications_read(self, user_id: int) -> int:
+        """
+        Mark all of a user's notifications as read
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Number of notifications that were unread
+        """
+        counts = self._unread_count_table()
+        if not counts.get(user_id):
+            return 0
+
+        notifications = self.data_manager.load("notifications.json")
+        now = datetime.now().isoformat()
+        marked = 0
+        for notification in notifications:
+            if notification.get("user_id") == user_id and not notification.get("is_read"):
+                notification["is_read"] = True
+                notification["updated_at"] = now
+                marked += 1
+        if not self.data_manager.save("notifications.json", notifications):
+            raise ServiceError("Failed to mark notifications as read")
+
+        counts[user_id] = 0
+        self._unread_counts_version = self.data_manager.version("notifications.json")
+        return marked
 
     def get_user_wishlists(self, user_id: int) -> List[Dict[str, Any]]:
         """
@@ -211,6 +353,25 @@ class UserService(BaseService):
             self.logger.error(f"Error getting wishlists for user {user_id}: {e}")
             return []
 
+    def get_wishlist_by_id(self, wishlist_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a wishlist through the wishlists id index
+
+        The returned wishlist is shared with other callers, so treat it as
+        read-only.
+
+        Args:
+            wishlist_id: Wishlist ID
+
+        Returns:
+            The wishlist, or None if it doesn't exist
+        """
+        try:
+            return self.data_manager.get_index("wishlists.json").get(str(wishlist_id))
+        except Exception as e:
+            self.logger.error(f"Error getting wishlist {wishlist_id}: {e}")
+            return None
+
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new user account
@@ -230,12 +391,14 @@ class UserService(BaseService):
         """
         Get a user by email
 
+        Served from the memoized email index, since this runs on every
+        authenticated request; the returned user is shared, so treat it as
+        read-only.
+
         Args:
             email: User email
 
         Returns:
             User data if found, None otherwise
         """
-        users = self.data_manager.find_by_field(self.get_primary_file(), "email", email.lower())
-
-        return users[0] if users else None
+        return self.data_manager.get_index(self.get_primary_file(), "email").get(email.lower())
@@ -5,25 +5,52 @@ from functools import wraps
 import json
 import time
 import hashlib
+import asyncio
 from typing import Callable, Any, Optional, Union, Dict
-import redis
 import logging
-from ..config.settings import settings
+from config.settings import settings
+
+try:
+    import redis
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_INSTALLED = True
+except ImportError:
+    REDIS_INSTALLED = False
+
+    class RedisError(Exception):
+        """Placeholder so the except clauses below work without redis"""
 
 # Configure logging
 logger = logging.getLogger("cache")
 
-# Initialize Redis client
-try:
-    redis_client = redis.from_url(settings.redis_url)
-    # Test connection
-    redis_client.ping()
-    REDIS_AVAILABLE = True
-    logger.info(f"Redis connected at {settings.redis_url}")
-except (redis.ConnectionError, redis.exceptions.ConnectionError):
-    REDIS_AVAILABLE = False
-    redis_client = None
-    logger.warning(f"Redis connection failed at {settings.redis_url}. Caching disabled.")
+# Initialize Redis clients: the blocking one serves sync (threadpool) callers,
+# the asyncio one serves code running on the event loop
+REDIS_AVAILABLE = False
+redis_client = None
+async_redis_client = None
+if REDIS_INSTALLED and settings.redis_url:
+    try:
+        redis_client = redis.from_url(settings.redis_url)
+        # Test connection
+        redis_client.ping()
+        async_redis_client = aioredis.from_url(settings.redis_url)
+        REDIS_AVAILABLE = True
+        logger.info(f"Redis connected at {settings.redis_url}")
+    except RedisError:
+        redis_client = None
+        logger.warning(f"Redis connection failed at {settings.redis_url}. Caching disabled.")
+
+
+# Cross-worker single-flight: a worker that loses the SET NX race polls for
+# the winner's result until the winner releases its lock, for at most
+# SINGLE_FLIGHT_WAIT seconds, before computing
+SINGLE_FLIGHT_LOCK_TTL = 30
+SINGLE_FLIGHT_WAIT = 5.0
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+# In-process single-flight: cache key -> future of the computation in progress
+_inflight: dict[str, "asyncio.Future"] = {}
 
 
 def generate_cache_key(func_name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
@@ -62,68 +89,261 @@ def generate_cache_key(func_name: str, args: tuple, kwargs: Dict[str, Any]) -> s
     return f"cache:{hashlib.md5(key_base.encode()).hexdigest()}"
 
 
-def cache(ttl: int = 60, prefix: Optional[str] = None, key_builder: Optional[Callable] = None):
+def cache(ttl: int = 60, prefix: Optional[str] = None, key_builder: Optional[Callable] = None,
+          key: Optional[str] = None, min_execution_time: float = 0.01):
     """
     Cache decorator for FastAPI route handlers and other functions
-    
+
+    Works for both `async def` and plain `def` handlers; the wrapper keeps
+    the same kind so FastAPI still runs sync handlers in the threadpool.
+
+    For async functions, concurrent misses on the same key are coalesced:
+    within a worker they await one shared future, and across workers a
+    Redis SET NX lock lets a single worker call upstream while the others
+    poll for its cached result.
+
     Args:
         ttl: Time to live in seconds
         prefix: Optional prefix for cache key
         key_builder: Optional function to build cache key
-        
+        key: Optional key template formatted with the call's keyword arguments,
+            e.g. "avail:{property_id}:{start_date}:{end_date}", so related
+            entries can be invalidated by pattern
+        min_execution_time: Only cache results that took longer than this (seconds)
+
     Returns:
         Decorated function with caching
     """
     def decorator(func: Callable):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Skip caching if Redis is not available
-            if not REDIS_AVAILABLE or not redis_client:
-                return await func(*args, **kwargs)
-            
-            # Generate cache key
+        def build_key(args: tuple, kwargs: dict[str, Any]) -> str:
             if key_builder:
-                cache_key = key_builder(*args, **kwargs)
-            else:
-                func_name = f"{prefix}:{func.__name__}" if prefix else func.__name__
-                cache_key = generate_cache_key(func_name, args, kwargs)
-            
-            # Try to get from cache
-            cached_data = redis_client.get(cache_key)
-            if cached_data:
+                return key_builder(*args, **kwargs)
+            if key:
+                return f"cache:{key.format(**kwargs)}"
+            func_name = f"{prefix}:{func.__name__}" if prefix else func.__name__
+            return generate_cache_key(func_name, args, kwargs)
+
+        def decode_cached(cache_key: str, cached_data: Optional[bytes]) -> Any:
+            if cached_data is not None:
                 try:
                     logger.debug(f"Cache hit for {cache_key}")
                     return json.loads(cached_data)
                 except json.JSONDecodeError:
                     logger.warning(f"Failed to decode cached data for {cache_key}")
-                    # Continue with function execution
-            
-            # Cache miss, execute function
             logger.debug(f"Cache miss for {cache_key}")
+            return None
+
+        def encode_result(cache_key: str, result: Any, execution_time: float) -> Optional[str]:
+            # Only cache if execution time is significant
+            if execution_time < min_execution_time:
+                return None
+            try:
+                return json.dumps(result)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Failed to cache result for {cache_key}: {e}")
+                return None
+
+        # Redis errors degrade to a cache miss / skipped write
+        def get_cached(cache_key: str) -> Any:
+            try:
+                return decode_cached(cache_key, redis_client.get(cache_key))
+            except RedisError as e:
+                logger.error(f"Failed to read cache entry {cache_key}: {e}")
+                return None
+
+        def set_cached(cache_key: str, result: Any, execution_time: float) -> None:
+            payload = encode_result(cache_key, result, execution_time)
+            if payload is None:
+                return
+            try:
+                redis_client.setex(cache_key, ttl, payload)
+                logger.debug(f"Cached {cache_key} for {ttl}s (execution: {execution_time:.4f}s)")
+            except RedisError as e:
+                logger.error(f"Failed to write cache entry {cache_key}: {e}")
+
+        async def aget_cached(cache_key: str) -> Any:
+            try:
+                return decode_cached(cache_key, await async_redis_client.get(cache_key))
+            except RedisError as e:
+                logger.error(f"Failed to read cache entry {cache_key}: {e}")
+                return None
+
+        async def aset_cached(cache_key: str, result: Any, execution_time: float) -> None:
+            payload = encode_result(cache_key, result, execution_time)
+            if payload is None:
+                return
+            try:
+                await async_redis_client.setex(cache_key, ttl, payload)
+                logger.debug(f"Cached {cache_key} for {ttl}s (execution: {execution_time:.4f}s)")
+            except RedisError as e:
+                logger.error(f"Failed to write cache entry {cache_key}: {e}")
+
+        async def compute(cache_key: str, args: tuple, kwargs: dict[str, Any]) -> Any:
             start_time = time.time()
             result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
-            
-            # Cache the result
+            await aset_cached(cache_key, result, time.time() - start_time)
+            return result
+
+        async def compute_once(cache_key: str, args: tuple, kwargs: dict[str, Any]) -> Any:
+            # Only the worker holding the lock calls upstream; others wait for its result
+            lock_key = f"lock:{cache_key}"
             try:
-                # Only cache if execution time is significant (>10ms)
-                if execution_time > 0.01:
-                    redis_client.setex(
-                        cache_key,
-                        ttl,
-                        json.dumps(result)
-                    )
-                    logger.debug(f"Cached {cache_key} for {ttl}s (execution: {execution_time:.4f}s)")
-            except (TypeError, json.JSONDecodeError) as e:
-                logger.error(f"Failed to cache result for {cache_key}: {e}")
-            
+                acquired = await async_redis_client.set(
+                    lock_key, 1, nx=True, ex=SINGLE_FLIGHT_LOCK_TTL
+                )
+            except RedisError as e:
+                logger.error(f"Failed to take single-flight lock {lock_key}: {e}")
+                return await func(*args, **kwargs)
+
+            if acquired:
+                try:
+                    return await compute(cache_key, args, kwargs)
+                finally:
+                    try:
+                        await async_redis_client.delete(lock_key)
+                    except RedisError as e:
+                        logger.error(f"Failed to release single-flight lock {lock_key}: {e}")
+
+            # The winner may finish without caching (fast, unserializable or
+            # raised), so stop waiting as soon as its lock is released
+            waited = 0.0
+            while waited < SINGLE_FLIGHT_WAIT:
+                await asyncio.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+                waited += SINGLE_FLIGHT_POLL_INTERVAL
+                cached = await aget_cached(cache_key)
+                if cached is not None:
+                    return cached
+                try:
+                    if not await async_redis_client.exists(lock_key):
+                        break
+                except RedisError as e:
+                    logger.error(f"Failed to check single-flight lock {lock_key}: {e}")
+                    break
+            else:
+                logger.warning(f"Timed out waiting for {cache_key}, computing locally")
+
+            return await compute(cache_key, args, kwargs)
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                use_redis = REDIS_AVAILABLE and async_redis_client
+                cache_key = build_key(args, kwargs)
+
+                if use_redis:
+                    cached = await aget_cached(cache_key)
+                    if cached is not None:
+                        return cached
+
+                # Coalesce concurrent misses for the same key onto one call
+                pending = _inflight.get(cache_key)
+                if pending is not None:
+                    return await asyncio.shield(pending)
+
+                future = asyncio.get_running_loop().create_future()
+                _inflight[cache_key] = future
+                try:
+                    if use_redis:
+                        result = await compute_once(cache_key, args, kwargs)
+                    else:
+                        result = await func(*args, **kwargs)
+                    future.set_result(result)
+                    return result
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    future.set_exception(e)
+                    # Mark retrieved so an un-awaited future doesn't log a warning
+                    future.exception()
+                    raise
+                finally:
+                    _inflight.pop(cache_key, None)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Skip caching if Redis is not available
+            if not REDIS_AVAILABLE or not redis_client:
+                return func(*args, **kwargs)
+
+            cache_key = build_key(args, kwargs)
+            cached = get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+            start_time = time.time()
+            result = func(*args, **kwargs)
+            set_cached(cache_key, result, time.time() - start_time)
             return result
-        
+
         return wrapper
-    
+
     return decorator
 
 
+def get_cached_bytes(key: str) -> Optional[bytes]:
+    """
+    Get a pre-serialized response body stored with set_cached_bytes
+
+    Args:
+        key: Cache key without the "cache:" prefix
+
+    Returns:
+        The raw bytes, or None on a miss or when Redis is unavailable
+    """
+    if not REDIS_AVAILABLE or not redis_client:
+        return None
+
+    try:
+        return redis_client.get(f"cache:{key}")
+    except RedisError as e:
+        logger.error(f"Failed to read cache entry {key}: {e}")
+        return None
+
+
+def set_cached_bytes(key: str, value: bytes, ttl: int = 60) -> None:
+    """
+    Store a pre-serialized response body so hits can skip serialization
+
+    Args:
+        key: Cache key without the "cache:" prefix
+        value: Raw bytes to store
+        ttl: Time to live in seconds
+    """
+    if not REDIS_AVAILABLE or not redis_client:
+        return
+
+    try:
+        redis_client.setex(f"cache:{key}", ttl, value)
+    except RedisError as e:
+        logger.error(f"Failed to write cache entry {key}: {e}")
+
+
+async def aget_cached_bytes(key: str) -> Optional[bytes]:
+    """Async get_cached_bytes, for code running on the event loop"""
+    if not REDIS_AVAILABLE or not async_redis_client:
+        return None
+
+    try:
+        return await async_redis_client.get(f"cache:{key}")
+    except RedisError as e:
+        logger.error(f"Failed to read cache entry {key}: {e}")
+        return None
+
+
+async def aset_cached_bytes(key: str, value: bytes, ttl: int = 60) -> None:
+    """Async set_cached_bytes, for code running on the event loop"""
+    if not REDIS_AVAILABLE or not async_redis_client:
+        return
+
+    try:
+        await async_redis_client.setex(f"cache:{key}", ttl, value)
+    except RedisError as e:
+        logger.error(f"Failed to write cache entry {key}: {e}")
+
+
 def invalidate_cache(pattern: str = "*"):
     """
     Invalidate cache entries matching a pattern
@@ -142,8 +362,8 @@ def invalidate_cache(pattern: str = "*"):
         if not pattern.startswith("cache:"):
             pattern = f"cache:{pattern}"
         
-        # Find keys matching pattern
-        keys = redis_client.keys(pattern)
+        # Find keys matching pattern (SCAN doesn't block the server like KEYS)
+        keys = list(redis_client.scan_iter(match=pattern, count=500))
         if not keys:
             return 0
         
@@ -3,16 +3,32 @@ Data Manager Utility for JSON-based Mock Data Operations
 Provides comprehensive CRUD operations for managing JSON data files
 """
 
+import itertools
 import json
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
+from utils.request_cache import clear_request_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Write generation per data file, shared by every DataManager in the process
+# and bumped by each save. Part of version(), so a rewrite that keeps the
+# file's mtime and size (same-size status flips on coarse-mtime filesystems)
+# still looks new to in-process memos.
+_generation_counter = itertools.count(1)
+_file_generations: dict[Path, int] = {}
+
 
 class DataManager:
     """
@@ -39,6 +55,9 @@ class DataManager:
 
         # Ensure data directory exists
         self.base_path.mkdir(parents=True, exist_ok=True)
+
+        # Memoized field indexes: (file_name, kind, field) -> (version, index)
+        self._indexes: dict[tuple[str, str, str], tuple[Any, dict[str, Any]]] = {}
         logger.info(f"DataManager initialized with base path: {self.base_path}")
 
     def _get_file_path(self, file_name: str) -> Path:
@@ -68,10 +87,14 @@ class DataManager:
                 logger.warning(f"File not found: {file_path}")
                 return []
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.info(f"Successfully loaded {len(data) if isinstance(data, list) else 1} items from {file_name}")
-                return data if isinstance(data, list) else [data]
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(file_path.read_bytes())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+            logger.info(f"Successfully loaded {len(data) if isinstance(data, list) else 1} items from {file_name}")
+            return data if isinstance(data, list) else [data]
 
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {file_name}: {e}")
@@ -80,6 +103,103 @@ class DataManager:
             logger.error(f"Error loading {file_name}: {e}")
             raise
 
+    def stat_version(self, file_name: str) -> Optional[tuple[int, int]]:
+        """
+        Get a version token for a data file that every worker agrees on
+
+        Use this for keys shared between processes (e.g. Redis); in-process
+        memos should use version, which also sees this process's writes.
+
+        Args:
+            file_name: Name of the JSON file
+
+        Returns:
+            (mtime_ns, size) of the file, or None if it doesn't exist
+        """
+        try:
+            file_stat = self._get_file_path(file_name).stat()
+        except FileNotFoundError:
+            return None
+        return (file_stat.st_mtime_ns, file_stat.st_size)
+
+    def version(self, file_name: str) -> Optional[tuple[int, int, int]]:
+        """
+        Get a cheap version token for a data file
+
+        Args:
+            file_name: Name of the JSON file
+
+        Returns:
+            (mtime_ns, size, write generation) of the file, or None if it doesn't exist
+        """
+        file_version = self.stat_version(file_name)
+        if file_version is None:
+            return None
+        return file_version + (_file_generations.get(self._get_file_path(file_name), 0),)
+
+    def get_index(self, file_name: str, field: str = 'id') -> dict[str, dict[str, Any]]:
+        """
+        Get a memoized index of items keyed by str(item[field])
+
+        The index is rebuilt only when the file's version token changes, so
+        repeated lookups skip both the JSON load and the linear scan. The
+        returned items are shared between callers and must not be mutated.
+
+        Args:
+            file_name: Name of the JSON file
+            field: Field to index on (first occurrence wins, like find_by_id)
+
+        Returns:
+            Dictionary mapping stringified field values to items
+        """
+        key = (file_name, 'unique', field)
+        current_version = self.version(file_name)
+        cached = self._indexes.get(key)
+        if cached is not None and cached[0] == current_version:
+            return cached[1]
+
+        index: dict[str, dict[str, Any]] = {}
+        for item in self.load(file_name):
+            index.setdefault(str(item.get(field)), item)
+
+        self._indexes[key] = (current_version, index)
+        return index
+
+    def get_group_index(self, file_name: str, field: str) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get a memoized index of items grouped by str(item[field])
+
+        Like get_index, but keeps every item for a value (e.g. all bookings
+        of a guest) in file order, so a lookup by a non-unique field is one
+        dict access instead of a full load and scan. Items are shared and
+        must not be mutated.
+
+        Args:
+            file_name: Name of the JSON file
+            field: Field to group on
+
+        Returns:
+            Dictionary mapping stringified field values to lists of items
+        """
+        key = (file_name, 'group', field)
+        current_version = self.version(file_name)
+        cached = self._indexes.get(key)
+        if cached is not None and cached[0] == current_version:
+            return cached[1]
+
+        index: dict[str, list[dict[str, Any]]] = {}
+        for item in self.load(file_name):
+            index.setdefault(str(item.get(field)), []).append(item)
+
+        self._indexes[key] = (current_version, index)
+        return index
+
+    def invalidate(self, file_name: str) -> None:
+        """Drop memoized indexes for a data file and bump its write generation"""
+        _file_generations[self._get_file_path(file_name)] = next(_generation_counter)
+        for key in [k for k in self._indexes if k[0] == file_name]:
+            del self._indexes[key]
+
     def save(self, file_name: str, data: List[Dict[str, Any]]) -> bool:
         """
         Save data to JSON file
@@ -92,6 +212,7 @@ class DataManager:
             True if successful, False otherwise
         """
         file_path = self._get_file_path(file_name)
+        clear_request_cache()
 
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
@@ -103,6 +224,9 @@ class DataManager:
         except Exception as e:
             logger.error(f"Error saving to {file_name}: {e}")
             return False
+        finally:
+            # After the write, so nothing memoized while it ran survives it
+            self.invalidate(file_name)
 
     def find_by_id(self, file_name: str, item_id: Union[int, str]) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,68 @@
+"""
+Request-scoped memoization for service reads
+"""
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Optional
+
+# Per-request memo dict; None outside a request, which disables memoization
+_request_cache: ContextVar[Optional[dict]] = ContextVar("request_cache", default=None)
+
+
+class RequestCacheMiddleware:
+    """
+    ASGI middleware that gives each HTTP request its own memo dict
+
+    Starlette copies the context into the threadpool for sync handlers,
+    so they share the same dict as the request that spawned them.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_cache.reset(token)
+
+
+def clear_request_cache() -> None:
+    """Forget everything memoized so far in the current request (call after writes)"""
+    memo = _request_cache.get()
+    if memo:
+        memo.clear()
+
+
+def request_memoized(func: Callable) -> Callable:
+    """
+    Memoize a function for the duration of the current request
+
+    Repeated calls with the same (hashable) arguments within one request
+    return the same result object, so callers must not mutate it. Calls
+    outside a request, or with unhashable arguments, are not memoized.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        memo = _request_cache.get()
+        if memo is None:
+            return func(*args, **kwargs)
+
+        key = (func, args, tuple(sorted(kwargs.items())))
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return func(*args, **kwargs)
+
+        result = func(*args, **kwargs)
+        memo[key] = result
+        return result
+
+    return wrapper
@@ -0,0 +1,15 @@
+"""
+JSON response classes shared by the app and routers
+"""
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson serializes large list payloads several times faster than the stdlib
+# encoder and handles datetime/UUID natively; fall back when it isn't installed
+DefaultJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse